@@ -0,0 +1,198 @@
+# -*- coding: UTF-8 -*-
+# For licensing information see LICENSE file included in the project's root directory.
+"""
+Benchmark suite for numeral system converters.
+
+Usage:
+
+    python -m benchmarks.run [-o REPORT] [-b BASELINE] [-t TOLERANCE] [-f FILTER] [--save-baseline]
+
+Every case converts a fixed sample of numbers; reported time is the best of several repeats, per single conversion, in seconds.
+Report is written in JSON. If a baseline report is given, cases slower than the baseline by more than the tolerance are reported as regressions, and the exit code is 1.
+"""
+
+import argparse, json, os, platform, random, sys, time
+
+from omninumeric import cyrillic, roman
+
+BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+TOLERANCE = 0.25  # Allowed relative slowdown against the baseline
+REPEAT = 5  # Count of repeats for every case
+DURATION = 0.2  # Minimum duration of a single repeat, in seconds
+
+FLAGS = (
+    "PLAIN",
+    "DELIM",
+    "NOTITLO",
+    "ENDDOT",
+    "PREDOT",
+    "DOT",
+    "WRAPDOT",
+    "DELIMDOT",
+    "ALLDOT",
+)
+MAGNITUDES = (1, 3, 10, 100, 1000, 10000)  # Counts of decimal digits
+
+generator = random.Random(0)
+SAMPLE = [generator.randrange(1, 1000000) for i in range(200)]
+ROMAN = list(range(1, 4000))
+
+
+def huge(digits, count=5):
+    "Get a sample of integers of given count of decimal digits."
+
+    return [generator.randrange(10 ** (digits - 1), 10**digits) for i in range(count)]
+
+
+def cases():
+    "Get benchmark cases: name, conversion function, sample."
+
+    result = []
+
+    for k in FLAGS:
+        flags = getattr(cyrillic, k)
+        result.append(
+            (
+                "cyrillic.write/{0}".format(k),
+                lambda n, flags=flags: cyrillic.write(n, flags),
+                SAMPLE,
+            )
+        )
+
+    for k in ("PLAIN", "DELIM"):
+        flags = getattr(cyrillic, k)
+        result.append(
+            (
+                "cyrillic.read/{0}".format(k),
+                cyrillic.read,
+                [cyrillic.write(n, flags) for n in SAMPLE],
+            )
+        )
+
+    result.append(("roman.write", roman.write, ROMAN))
+    result.append(("roman.read", roman.read, [roman.write(n) for n in ROMAN]))
+
+    for k in MAGNITUDES:
+        sample = huge(k, 1 if k > 1000 else 5)
+        result.append(("cyrillic.write/digits-{0}".format(k), cyrillic.write, sample))
+        result.append(
+            (
+                "cyrillic.read/digits-{0}".format(k),
+                cyrillic.read,
+                [cyrillic.write(n) for n in sample],
+            )
+        )
+
+    return result
+
+
+def measure(function, sample):
+    "Measure time of a single conversion, in seconds."
+
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for i in range(loops):
+            for k in sample:
+                function(k)
+        elapsed = time.perf_counter() - start
+
+        if elapsed >= DURATION:
+            break
+        loops *= 2
+
+    best = elapsed
+    for i in range(REPEAT - 1):
+        start = time.perf_counter()
+        for i in range(loops):
+            for k in sample:
+                function(k)
+        best = min(best, time.perf_counter() - start)
+
+    return best / loops / len(sample)
+
+
+def run(pattern=""):
+    "Run benchmark cases with names containing @pattern. Returns a report."
+
+    results = {}
+    for name, function, sample in cases():
+        if pattern in name:
+            results[name] = measure(function, sample)
+            print("{0:32} {1:12.3f} us".format(name, results[name] * 1e6))
+
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+
+
+def compare(report, baseline, tolerance=TOLERANCE):
+    "Compare a report against a baseline report. Returns names of regressed cases."
+
+    regressions = []
+
+    for name, value in sorted(report["results"].items()):
+        reference = baseline["results"].get(name)
+        if not reference:
+            continue
+
+        ratio = value / reference
+        regressed = ratio > 1 + tolerance
+        if regressed:
+            regressions.append(name)
+        print(
+            "{0:32} {1:8.2f}x{2}".format(
+                name, ratio, "  REGRESSION" if regressed else ""
+            )
+        )
+
+    return regressions
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description="Run omninumeric benchmarks.")
+    parser.add_argument("-o", "--output", help="write JSON report to this file")
+    parser.add_argument(
+        "-b", "--baseline", default=BASELINE, help="baseline JSON report to compare to"
+    )
+    parser.add_argument(
+        "-t",
+        "--tolerance",
+        type=float,
+        default=TOLERANCE,
+        help="allowed relative slowdown against the baseline",
+    )
+    parser.add_argument(
+        "-f", "--filter", default="", help="run only cases containing this string"
+    )
+    parser.add_argument(
+        "--save-baseline", action="store_true", help="save report as the baseline"
+    )
+    args = parser.parse_args(args)
+
+    report = run(args.filter)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=4, sort_keys=True)
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=4, sort_keys=True)
+        return 0
+
+    if not os.path.exists(args.baseline):
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+
+    print()
+    return 1 if compare(report, baseline, args.tolerance) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
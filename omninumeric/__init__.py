@@ -1,3 +1,31 @@
 from .omninumeric import *
 
-__all__ = ["Dictionary", "IntConverter", "StrConverter"]
+__all__ = [
+    "ERROR_NONE",
+    "ERROR_TYPE",
+    "ERROR_EMPTY",
+    "ERROR_PATTERN",
+    "Dictionary",
+    "NumberConverter",
+    "IntConverter",
+    "StrConverter",
+    "detect_iter",
+    "detect_and_read",
+]
+
+
+SUBMODULES = ("cyrillic", "greek", "roman", "cache", "parallel", "aio", "table")
+
+
+def __getattr__(name):
+    "Import submodules on first attribute access, i.e. omninumeric.cyrillic (Python 3.7+)."
+
+    if name in SUBMODULES:
+        __import__("{0}.{1}".format(__name__, name))
+        return globals()[name]
+
+    raise AttributeError("module {0!r} has no attribute {1!r}".format(__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(SUBMODULES))
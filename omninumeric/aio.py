@@ -0,0 +1,218 @@
+# -*- coding: UTF-8 -*-
+# For licensing information see LICENSE file included in the project's root directory.
+"""
+This module provides asyncio interface for reading and writing numbers.
+
+Conversion runs in an executor, so that the event loop is not blocked. Event loop default executor is used unless another one is set with set_executor() or passed explicitly.
+Conversion functions are sent to executors as module-level functions, so that process pool executors can run them as well.
+"""
+
+__all__ = ["set_executor", "read", "write", "read_stream", "write_stream"]
+
+
+import asyncio
+import importlib
+from collections import deque
+from functools import partial
+from omninumeric import parallel
+
+CHUNKSIZE = 1000  # Default count of numbers converted in the executor at once
+PENDING = 4  # Default maximum count of chunks converted at the same time
+
+default = None  # Default executor for conversion, None for event loop default executor
+
+
+def set_executor(value):
+    "Set default executor for conversion. None sets event loop default executor."
+
+    global default
+    default = value
+
+
+def getFunction(system, direction, flags=0):
+    """
+    Get conversion function for a numeral system, which can be pickled.
+
+    @system - numeral system name ("cyrillic" or "roman")
+    @direction - "read" or "write"
+    @flags - conversion flags
+    """
+
+    parallel.getFunction(system, direction, flags)  # Validate arguments
+
+    module = importlib.import_module(parallel.SYSTEMS[system])
+    return partial(getattr(module, direction), flags=flags)
+
+
+def convertChunk(function, chunk):
+    "Convert a chunk of numbers."
+
+    return [function(k) for k in chunk]
+
+
+async def write(number, flags=0, system="cyrillic", executor=None):
+    """
+    Convert into a numeral system in an executor.
+
+    @number - number to convert
+    @flags - conversion flags
+    @system - numeral system name ("cyrillic" or "roman")
+    @executor - executor to use instead of the default one
+    """
+
+    function = getFunction(system, "write", flags)
+    return await asyncio.get_event_loop().run_in_executor(
+        executor or default, function, number
+    )
+
+
+async def read(number, flags=0, system="cyrillic", executor=None):
+    """
+    Convert from a numeral system in an executor.
+
+    @number - number to convert
+    @flags - conversion flags
+    @system - numeral system name ("cyrillic" or "roman")
+    @executor - executor to use instead of the default one
+    """
+
+    function = getFunction(system, "read", flags)
+    return await asyncio.get_event_loop().run_in_executor(
+        executor or default, function, number
+    )
+
+
+class Stream:
+    """
+    Asynchronous iterator over numbers converted in chunks in an executor.
+
+    At most @pending chunks are read from the source and converted at the same time; the source is not read further until converted numbers are consumed.
+
+    @values - iterable or asynchronous iterable of numbers
+    @function - conversion function
+    @chunksize - count of numbers converted at once
+    @pending - maximum count of chunks converted at the same time
+    @executor - executor to use instead of the default one
+    """
+
+    def __init__(
+        self, values, function, chunksize=CHUNKSIZE, pending=PENDING, executor=None
+    ):
+        if hasattr(values, "__aiter__"):
+            self.source = values.__aiter__()
+            self.asynchronous = True
+        else:
+            self.source = iter(values)
+            self.asynchronous = False
+
+        self.function = function
+        self.chunksize = chunksize
+        self.pending = pending
+        self.executor = executor or default
+        self.exhausted = False
+        self.futures = deque()  # Chunks being converted
+        self.ready = deque()  # Converted numbers
+
+    def __aiter__(self):
+        return self
+
+    async def take(self):
+        "Read a chunk of numbers from the source."
+
+        chunk = []
+
+        while len(chunk) < self.chunksize:
+            try:
+                if self.asynchronous:
+                    chunk.append(await self.source.__anext__())
+                else:
+                    chunk.append(next(self.source))
+            except (StopIteration, StopAsyncIteration):
+                self.exhausted = True
+                break
+
+        return chunk
+
+    async def fill(self):
+        "Submit chunks for conversion until pending limit is reached or the source is exhausted."
+
+        loop = asyncio.get_event_loop()
+
+        while not self.exhausted and len(self.futures) < self.pending:
+            chunk = await self.take()
+            if chunk:
+                self.futures.append(
+                    loop.run_in_executor(
+                        self.executor, convertChunk, self.function, chunk
+                    )
+                )
+
+    async def __anext__(self):
+        while not self.ready:
+            await self.fill()
+
+            if not self.futures:
+                raise StopAsyncIteration
+
+            try:
+                self.ready.extend(await self.futures.popleft())
+            except BaseException:
+                for k in self.futures:
+                    k.cancel()
+                self.futures.clear()
+                self.exhausted = True
+                raise
+
+        return self.ready.popleft()
+
+
+def write_stream(
+    values,
+    flags=0,
+    system="cyrillic",
+    chunksize=CHUNKSIZE,
+    pending=PENDING,
+    executor=None,
+):
+    """
+    Convert numbers into a numeral system in chunks in an executor.
+
+    @values - iterable or asynchronous iterable of numbers
+    @flags - conversion flags
+    @system - numeral system name ("cyrillic" or "roman")
+    @chunksize - count of numbers converted at once
+    @pending - maximum count of chunks converted at the same time
+    @executor - executor to use instead of the default one
+
+    Returns an asynchronous iterator over converted numbers, in input order.
+    """
+
+    return Stream(
+        values, getFunction(system, "write", flags), chunksize, pending, executor
+    )
+
+
+def read_stream(
+    values,
+    flags=0,
+    system="cyrillic",
+    chunksize=CHUNKSIZE,
+    pending=PENDING,
+    executor=None,
+):
+    """
+    Convert numbers from a numeral system in chunks in an executor.
+
+    @values - iterable or asynchronous iterable of numbers
+    @flags - conversion flags
+    @system - numeral system name ("cyrillic" or "roman")
+    @chunksize - count of numbers converted at once
+    @pending - maximum count of chunks converted at the same time
+    @executor - executor to use instead of the default one
+
+    Returns an asynchronous iterator over converted numbers, in input order.
+    """
+
+    return Stream(
+        values, getFunction(system, "read", flags), chunksize, pending, executor
+    )
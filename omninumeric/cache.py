@@ -0,0 +1,137 @@
+# -*- coding: UTF-8 -*-
+# For licensing information see LICENSE file included in the project's root directory.
+"""
+This module provides an opt-in conversion cache for read() and write() functions of numeral systems.
+
+Cache is disabled by default. Use enable() to turn it on.
+"""
+
+__all__ = ["enable", "disable", "cache_info", "cache_clear"]
+
+
+from collections import OrderedDict, namedtuple
+from functools import wraps
+
+MAXSIZE = 1024  # Default maximum count of cached conversions
+
+CacheInfo = namedtuple(
+    "CacheInfo", ["hits", "misses", "maxsize", "currsize", "enabled"]
+)  # Cache statistics, enabled is False if caching is disabled
+CacheInfo.__new__.__defaults__ = (True,)
+
+
+class Cache:
+    """
+    Thread-safe conversion cache with LRU eviction.
+
+    @maxsize - maximum count of cached conversions, None for unbounded cache
+    """
+
+    def __init__(self, maxsize=MAXSIZE):
+        import threading  # Imported on first use to keep package import fast
+
+        self.maxsize = maxsize
+        self.data = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def call(self, key, function, *args):
+        "Get cached result for @key, or call @function and cache its result. Errors are not cached."
+
+        with self.lock:
+            if key in self.data:
+                self.hits += 1
+                self.data.move_to_end(key)
+                return self.data[key]
+            self.misses += 1
+
+        result = function(*args)
+
+        with self.lock:
+            self.data[key] = result
+            self.data.move_to_end(key)
+            if self.maxsize is not None and len(self.data) > self.maxsize:
+                self.data.popitem(last=False)
+
+        return result
+
+    def info(self):
+        with self.lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self.data))
+
+    def clear(self):
+        with self.lock:
+            self.data.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+current = None  # Active cache, None if caching is disabled
+
+
+def enable(maxsize=MAXSIZE):
+    """
+    Turn conversion cache on, discarding the previous one.
+
+    @maxsize - maximum count of cached conversions, None for unbounded cache
+    """
+
+    global current
+    current = Cache(maxsize)
+
+
+def disable():
+    "Turn conversion cache off."
+
+    global current
+    current = None
+
+
+def cache_info():
+    "Get cache statistics: hits, misses, maximum and current size, and whether caching is enabled."
+
+    cache = current
+    return CacheInfo(0, 0, 0, 0, False) if cache is None else cache.info()
+
+
+def cache_clear():
+    "Clear cache and its statistics."
+
+    cache = current
+    if cache is not None:
+        cache.clear()
+
+
+def cached(system, direction):
+    """
+    Cache conversion function results if conversion cache is enabled.
+
+    @system - numeral system name
+    @direction - "read" or "write"
+
+    Only int and str numbers with int flags are cached, others are converted without cache. Cache key includes number type, so that i.e. True is not taken for 1.
+    """
+
+    def decorator(function):
+        @wraps(function)
+        def wrapper(number, flags=0):
+            cache = current
+
+            if (
+                cache is None
+                or type(number) not in (int, str)
+                or type(flags) is not int
+            ):
+                return function(number, flags)
+
+            return cache.call(
+                (system, direction, type(number), number, flags),
+                function,
+                number,
+                flags,
+            )
+
+        return wrapper
+
+    return decorator
@@ -11,5 +11,17 @@ __all__ = [
     "WRAPDOT",
     "ALLDOT",
     "read",
+    "read_bytes",
+    "read_fuzzy",
     "write",
+    "read_many",
+    "write_many",
+    "write_into",
+    "write_lines",
+    "compile_writer",
+    "sequence",
+    "Numeral",
+    "try_read",
+    "try_read_many",
+    "scan",
 ]
@@ -3,9 +3,9 @@
 # To learn about Cyrillic numeral system (CU), see INTRODUCTION.md
 "This module provides tools for reading and writing numbers in Cyrillic numeral system."
 
-import re
-from omninumeric import greek
-
+import omninumeric
+from functools import total_ordering
+from omninumeric import cache, greek, table
 
 PLAIN = greek.PLAIN  # Write in plain style flag
 DELIM = greek.DELIM  # Read/write in delim style flag
@@ -59,9 +59,20 @@ class Const:
 class IntConverter(greek.IntConverter):
     "Number converter into Cyrillic numeral system."
 
+    __slots__ = ()
+
     dict_ = Dictionary
     const = Const
 
+    swap_pattern = omninumeric.Pattern(
+        lambda cls: "({0})([{1}])".format(cls.dict_.get(10), cls.dict_.digits())
+    )  # Numerals 11-19 to swap
+    titlo_pattern = omninumeric.Pattern(
+        lambda cls: r"([\S]+)(?<![{0}\{1}])([\S])$".format(
+            cls.const.THOUSAND, cls.const.DELIMETER
+        )
+    )  # Last numeral, unless preceded by a mark
+
     def ambiguityCheck(self, cond, flag):
         "Force delimeter for ambiguous numbers (i.e. ҂а҃і and ҂а.і҃)."
         if self.hasFlag(cond):
@@ -80,11 +91,7 @@ class IntConverter(greek.IntConverter):
 
         for i, k in enumerate(self.groups):
 
-            self.groups[i] = re.sub(
-                "({0})([{1}])".format(self.dict_.get(10), self.dict_.digits()),
-                "\g<2>\g<1>",
-                self.groups[i],
-            )
+            self.groups[i] = self.swap_pattern.sub(r"\g<2>\g<1>", self.groups[i])
 
         return self
 
@@ -92,12 +99,8 @@ class IntConverter(greek.IntConverter):
         'Apply "titlo" decorator unless appropriate flag is set.'
 
         if not self.hasFlag(cond):
-            result = re.subn(
-                "([\S]+)(?<![{0}\{1}])([\S])$".format(
-                    self.const.THOUSAND, self.const.DELIMETER
-                ),
-                "\g<1>{0}\g<2>".format(self.const.TITLO),
-                self.target,
+            result = self.titlo_pattern.subn(
+                r"\g<1>{0}\g<2>".format(self.const.TITLO), self.target
             )
             self.target = (
                 result[0]
@@ -149,9 +152,429 @@ class IntConverter(greek.IntConverter):
         )
 
 
+@omninumeric.NumberConverter.register
+class TableConverter:
+    """
+    Table-driven number converter into Cyrillic numeral system.
+
+    Produces the same output as IntConverter, but looks numeral groups up in tables built once on first use.
+    """
+
+    dict_ = Dictionary
+    const = Const
+
+    LIMIT = 8  # Count of lowest group indexes to build glyph tables for
+
+    swapped = None  # Glyphs for group values 0-999 with digits 11-19 swapped
+    unswapped = None  # Glyphs for group values 0-999 in order of value
+    tables = {}  # Glyph tables, by group index and style
+    arrays = {}  # NumPy glyph tables, by group index and style
+    writers = {}  # Compiled converter functions, by flags
+    emitters = {}  # Compiled converter functions writing into sinks, by flags
+    parts = {}  # Group separator and decorating functions, by flags
+
+    compiled = ("writers",)  # Caches of functions compiled to record instrumentation
+
+    @classmethod
+    def buildTables(cls):
+        "Build glyph tables for every numeral group value."
+
+        swapped = [""]
+        unswapped = [""]
+
+        for k in range(1, 1000):
+            hundreds = cls.dict_.get(k // 100 * 100) or ""
+            tens = cls.dict_.get(k // 10 % 10 * 10) or ""
+            digits = cls.dict_.get(k % 10) or ""
+
+            unswapped.append("{0}{1}{2}".format(hundreds, tens, digits))
+            swapped.append(
+                "{0}{1}{2}".format(hundreds, digits, tens)
+                if k // 10 % 10 == 1
+                else unswapped[k]
+            )
+
+        cls.swapped = tuple(swapped)
+        cls.unswapped = tuple(unswapped)
+
+    @classmethod
+    def appendTitlo(cls, target):
+        'Apply "titlo" decorator before the last numeral, or after it if it is preceded by a mark.'
+
+        if len(target) > 1 and target[-2] not in (
+            cls.const.THOUSAND,
+            cls.const.DELIMETER,
+        ):
+            return target[:-1] + cls.const.TITLO + target[-1]
+
+        return target + cls.const.TITLO
+
+    @classmethod
+    def groupGlyphs(cls, index, value, delim):
+        "Get glyphs for a numeral group of given index and value, with thousand marks."
+
+        if not index:
+            return cls.swapped[value]
+
+        thousand = cls.const.THOUSAND * index
+        if delim:
+            return thousand + cls.swapped[value] if value else ""
+
+        return thousand + thousand.join(cls.unswapped[value]) if value else ""
+
+    @classmethod
+    def groupTable(cls, index, delim):
+        "Get glyphs for numeral groups of given index and every value."
+
+        key = (index, bool(delim))
+
+        if key not in cls.tables:
+            if cls.swapped is None:
+                cls.buildTables()
+
+            cls.tables[key] = tuple(
+                cls.groupGlyphs(index, k, delim) for k in range(1000)
+            )
+
+        return cls.tables[key]
+
+    @classmethod
+    def compileParts(cls, flags=0):
+        """
+        Compile functions applying flags to a number being written, cached per flags combination.
+
+        Returns a pair of functions: getting group separator for a list of numeral groups (lowest first), and applying decorators to the joined groups.
+        """
+
+        if flags in cls.parts:
+            return cls.parts[flags]
+
+        delimeter = cls.const.DELIMETER
+
+        if flags & DOT:
+
+            def separator(groups):
+                return delimeter
+
+        elif flags & DELIM:
+
+            def separator(groups):
+                "Force delimeter for ambiguous numbers (i.e. ҂а҃і and ҂а.і҃)."
+
+                if groups[0] // 10 % 10 == 1 and groups[1] // 10 % 10 == 0:
+                    return delimeter
+                return ""
+
+        else:
+
+            def separator(groups):
+                return ""
+
+        prefix = delimeter if flags & PREDOT else ""
+        suffix = delimeter if flags & ENDDOT else ""
+
+        if flags & NOTITLO:
+
+            def finish(target):
+                return prefix + target + suffix
+
+        else:
+            appendTitlo = cls.appendTitlo
+
+            def finish(target):
+                return prefix + appendTitlo(target) + suffix
+
+        cls.parts[flags] = separator, finish
+        return separator, finish
+
+    @classmethod
+    def compile(cls, flags=0):
+        """
+        Compile a converter function into Cyrillic numeral system for given flags.
+
+        Flags are resolved once, so that the function returned does not check them. Functions are cached per flags combination.
+        """
+
+        if flags in cls.writers:
+            return cls.writers[flags]
+
+        delim = flags & DELIM
+        tables = tuple(cls.groupTable(i, delim) for i in range(cls.LIMIT))
+        limit = cls.LIMIT
+        groupGlyphs = cls.groupGlyphs
+        breakIntoGroups = greek.IntConverter.splitGroups
+        separator, finish = cls.compileParts(flags)
+
+        small = ("",) + tuple(finish(k) for k in tables[0][1:])  # Numbers 1-999
+
+        def convert(number):
+            if type(number) is not int or number <= 0:
+                omninumeric.isinstanceEx(number, int, "Integer required, got {0}")
+                raise ValueError("Natural number required")
+
+            if number < 1000:
+                return small[number]
+
+            groups = breakIntoGroups(number)
+            dot = separator(groups)
+            result = []
+
+            for i, k in enumerate(groups):
+                if k:
+                    glyphs = tables[i][k] if i < limit else groupGlyphs(i, k, delim)
+                    result.append(glyphs + dot if result else glyphs)
+
+            result.reverse()
+            return finish("".join(result))
+
+        instrumentation = omninumeric.NumberConverter.instrumentation
+        if instrumentation is not None:
+            convert = instrumentation.bind(convert, cls, "convert")
+
+        cls.writers[flags] = convert
+        return convert
+
+    @classmethod
+    def compileInto(cls, flags=0):
+        """
+        Compile a converter function into Cyrillic numeral system for given flags, writing into a sink instead of returning a string.
+
+        The function returned takes a number and a sink function (i.e. list.append or StringIO.write), and passes glyphs of numeral groups and decorators to the sink one by one, so that the whole number is never built. Functions are cached per flags combination.
+        """
+
+        if flags in cls.emitters:
+            return cls.emitters[flags]
+
+        delim = flags & DELIM
+        tables = tuple(cls.groupTable(i, delim) for i in range(cls.LIMIT))
+        limit = cls.LIMIT
+        groupGlyphs = cls.groupGlyphs
+        appendTitlo = cls.appendTitlo
+        breakIntoGroups = greek.IntConverter.splitGroups
+        separator, finish = cls.compileParts(flags)
+
+        small = ("",) + tuple(finish(k) for k in tables[0][1:])  # Numbers 1-999
+        # Lowest groups with "titlo" applied, unless it depends on a preceding group
+        titled = tuple(appendTitlo(k) if len(k) > 1 else k for k in tables[0])
+
+        titlo = "" if flags & NOTITLO else cls.const.TITLO
+        prefix = cls.const.DELIMETER if flags & PREDOT else ""
+        suffix = cls.const.DELIMETER if flags & ENDDOT else ""
+
+        def convert(number, write):
+            if type(number) is not int or number <= 0:
+                omninumeric.isinstanceEx(number, int, "Integer required, got {0}")
+                raise ValueError("Natural number required")
+
+            if number < 1000:
+                write(small[number])
+                return
+
+            groups = breakIntoGroups(number)
+            dot = separator(groups)
+            last = 0  # Lowest non-empty group
+            while not groups[last]:
+                last += 1
+
+            if prefix:
+                write(prefix)
+
+            for i in range(len(groups) - 1, last, -1):
+                k = groups[i]
+                if k:
+                    write(tables[i][k] if i < limit else groupGlyphs(i, k, delim))
+                    if dot:
+                        write(dot)
+
+            k = groups[last]
+            if not last:
+                glyphs = tables[0][k]
+            else:
+                glyphs = (
+                    tables[last][k] if last < limit else groupGlyphs(last, k, delim)
+                )
+
+            if not titlo:
+                write(glyphs)
+            elif len(glyphs) > 1:
+                write(titled[k] if not last else appendTitlo(glyphs))
+            elif dot:  # "Titlo" follows a single numeral after a delimeter
+                write(glyphs)
+                write(titlo)
+            else:
+                write(titlo)
+                write(glyphs)
+
+            if suffix:
+                write(suffix)
+
+        cls.emitters[flags] = convert
+        return convert
+
+    @classmethod
+    def convert(cls, number, flags=0):
+        "Convert into Cyrillic numeral system. Uses plain style by default."
+
+        return cls.compile(flags)(number)
+
+    @classmethod
+    def joinGroups(cls, groups, dot, delim):
+        "Join glyphs of numeral groups above the lowest one, highest first."
+
+        result = []
+
+        for i in range(len(groups) - 1, 0, -1):
+            k = groups[i]
+            if k:
+                result.append(
+                    cls.groupTable(i, delim)[k]
+                    if i < cls.LIMIT
+                    else cls.groupGlyphs(i, k, delim)
+                )
+
+        return dot.join(result)
+
+    @classmethod
+    def sequence(cls, start, stop, flags=0):
+        """
+        Generate numbers in Cyrillic numeral system for natural numbers from @start to @stop (exclusive).
+
+        Numeral groups are stepped like an odometer: only the lowest group changes on every step, and higher groups are joined again once in 1000 steps.
+        """
+
+        delim = flags & DELIM
+        separator, finish = cls.compileParts(flags)
+        lowest = cls.groupTable(0, delim)
+
+        groups = greek.IntConverter.splitGroups(start)
+        higher = {}  # Joined higher groups, by separator
+
+        for number in range(start, stop):
+            if groups[0] == 1000:  # Carry into higher groups
+                groups[0] = 0
+                i = 1
+                while i < len(groups) and groups[i] == 999:
+                    groups[i] = 0
+                    i += 1
+                if i < len(groups):
+                    groups[i] += 1
+                else:
+                    groups.append(1)
+                higher.clear()
+
+            low = groups[0]
+
+            if len(groups) == 1:
+                yield finish(lowest[low])
+            else:
+                dot = separator(groups)
+                if dot not in higher:
+                    higher[dot] = cls.joinGroups(groups, dot, delim)
+                yield finish(higher[dot] + dot + lowest[low] if low else higher[dot])
+
+            groups[0] = low + 1
+
+    @classmethod
+    def arrayTables(cls, index, delim):
+        """
+        Get NumPy glyph tables for numeral groups of given index.
+
+        Returns plain glyphs, glyphs with titlo applied, and glyphs with titlo applied after a preceding numeral.
+        """
+
+        key = (index, bool(delim))
+
+        if key not in cls.arrays:
+            numpy = omninumeric.getNumpy()
+            plain = cls.groupTable(index, delim)
+            titled = [""] + [cls.appendTitlo(k) for k in plain[1:]]
+            following = [""] + [k[:-1] + cls.const.TITLO + k[-1] for k in plain[1:]]
+
+            cls.arrays[key] = tuple(
+                numpy.array(k, dtype=object) for k in (plain, titled, following)
+            )
+
+        return cls.arrays[key]
+
+    @classmethod
+    def convertArray(cls, values, flags=0):
+        """
+        Convert a NumPy integer array into Cyrillic numeral system.
+
+        Numbers are grouped by count of numeral groups, so that groups of all numbers of the same magnitude are extracted and translated at once.
+        Returns NumPy object array of the same shape.
+        """
+
+        numpy = omninumeric.getNumpy()
+        shape = values.shape
+        values = values.ravel().astype(
+            numpy.uint64 if values.dtype.kind == "u" else numpy.int64, copy=False
+        )  # Small types overflow when split into groups
+        result = numpy.empty(values.size, dtype=object)
+
+        if not values.size:
+            return result.reshape(shape)
+
+        if values.min() <= 0:
+            raise ValueError("Natural number required")
+
+        counts = numpy.ones(values.size, dtype=numpy.int8)
+        bound, top = 1000, int(values.max())
+        while bound <= top:
+            counts += values >= bound
+            bound *= 1000
+
+        delim = flags & DELIM
+
+        for count in numpy.unique(counts).tolist():
+            index = numpy.nonzero(counts == count)[0]
+            source = values[index]
+            groups = numpy.empty((count, index.size), dtype=numpy.int64)
+
+            for i in range(count):
+                groups[i] = source % 1000
+                source = source // 1000
+
+            dot = numpy.full(index.size, bool(flags & DOT))
+            if delim and count > 1:
+                dot |= (groups[0] // 10 % 10 == 1) & (groups[1] // 10 % 10 == 0)
+
+            lower = numpy.zeros(index.size, dtype=bool)  # Any lower group is non-zero
+            target = None
+
+            for i, k in enumerate(groups):
+                plain, titled, following = cls.arrayTables(i, delim)
+                nonzero = k != 0
+                group = plain[k]
+                group = numpy.where(
+                    nonzero & lower & dot, group + cls.const.DELIMETER, group
+                )
+
+                if not flags & NOTITLO:
+                    if not i and count > 1:
+                        titled = numpy.where(dot, titled[k], following[k])
+                    else:
+                        titled = titled[k]
+                    group = numpy.where(nonzero & ~lower, titled, group)
+
+                target = group if target is None else group + target
+                lower |= nonzero
+
+            if flags & PREDOT:
+                target = cls.const.DELIMETER + target
+            if flags & ENDDOT:
+                target = target + cls.const.DELIMETER
+
+            result[index] = target
+
+        return result.reshape(shape)
+
+
 class StrConverter(greek.StrConverter):
     "Number converter from Cyrillic numeral system."
 
+    __slots__ = ()
+
     dict_ = Dictionary
     const = Const
 
@@ -163,23 +586,66 @@ class StrConverter(greek.StrConverter):
         dict_.get(10),
     )  # Regular expression for typical Cyrillic numeral system number
 
-    def prepare(self):
-        "Prepare source number for conversion."
+    token_template = r"(?<![\w{0}{1}])\{2}?[{0}{3}](?:[{0}{3}]|\{2}(?=[{0}{3}]))*{1}[{3}]?\{2}?(?![\w{0}{1}])"  # Regular expression template for a Cyrillic numeral system number in text
+    token_regex = token_template.format(
+        const.THOUSAND,
+        const.TITLO,
+        const.DELIMETER,
+        dict_.hundreds() + dict_.tens() + dict_.digits(),
+    )  # Regular expression for a Cyrillic numeral system number in text
+    detection_regex = token_template.format(
+        const.THOUSAND,
+        const.TITLO,
+        const.DELIMETER,
+        dict_.hundreds()
+        + dict_.tens()
+        + dict_.digits()
+        + omninumeric.Normalizer.caseVariants(
+            dict_.hundreds() + dict_.tens() + dict_.digits()
+        ),
+    )  # Regular expression for a Cyrillic numeral system number in text in any case, without inline flags, which can not be scoped before Python 3.6
+    notitlo_token_regex = r"(?<![\w{0}{1}])\{2}?[{0}{3}](?:[{0}{1}{3}]|\{2}(?=[{0}{3}]))*\{2}?(?![\w{0}{1}])".format(
+        const.THOUSAND,
+        const.TITLO,
+        const.DELIMETER,
+        dict_.hundreds() + dict_.tens() + dict_.digits(),
+    )  # Regular expression for a Cyrillic numeral system number in text, "titlo" decorator optional
+
+    EQUIVALENTS = {
+        "": const.TITLO + const.DELIMETER + "\u0487\u0303\ua66f\ufe2e\ufe2f",
+        "а": "aã",
+        "є": "еe",
+        "ѕ": "s",
+        "і": "i",
+        "к": "k",
+        "ѻ": "оo",
+        "р": "p",
+        "с": "c",
+        "у": "yѵ",
+        "х": "x",
+    }  # Decorators and alternative "titlo" marks to strip, look-alikes and variant forms of numerals
 
-        super().prepare()
-        self.source = re.sub(
-            "[{0}\{1}]".format(self.const.TITLO, self.const.DELIMETER),
-            "",
-            self.source,
-        )  # Strip ҃decorators
+    number_pattern = omninumeric.Pattern(lambda cls: "{0}+".format(cls.regex))
+    group_pattern = omninumeric.Pattern(lambda cls: cls.regex)
+    token_pattern = omninumeric.Pattern(lambda cls: "(?i)" + cls.token_regex)
+    notitlo_token_pattern = omninumeric.Pattern(
+        lambda cls: "(?i)" + cls.notitlo_token_regex
+    )
 
-        return self
+    @classmethod
+    def tokenCharset(cls):
+        "Get a set of characters numbers in text consist of, in any case."
+
+        result = set(cls.dict_.hundreds() + cls.dict_.tens() + cls.dict_.digits())
+        result |= set(str.upper("".join(result)))
+        result |= {cls.const.THOUSAND, cls.const.TITLO, cls.const.DELIMETER}
+        return result
 
     def validate(self):
         "Validate that source number is a non-empty string and matches the pattern for Cyrillic numeral system numbers."
 
         super().validate()
-        if not re.fullmatch("{0}+".format(self.regex), self.source):
+        if not self.number_pattern.fullmatch(self.source):
             raise ValueError(
                 "String does not match any pattern for Cyrillic numeral system numbers"
             )
@@ -191,7 +657,7 @@ class StrConverter(greek.StrConverter):
         return super().calculateMultiplier(index, group, cls.const.THOUSAND)
 
     def breakIntoGroups(self):
-        return super().breakIntoGroups(self.regex)
+        return super().breakIntoGroups(self.group_pattern)
 
     def translateGroups(self):
         return super().translateGroups(self.const.THOUSAND)
@@ -210,6 +676,471 @@ class StrConverter(greek.StrConverter):
         )
 
 
+@omninumeric.NumberConverter.register
+class StateConverter:
+    """
+    State machine number converter from Cyrillic numeral system.
+
+    Accepts the same strings as StrConverter and reads them in a single left-to-right pass, normalizing characters by table lookup as they are read: numeral groups are delimited by a state machine replicating StrConverter.regex.
+    """
+
+    dict_ = Dictionary
+    const = Const
+
+    HUNDREDS, TENS, DIGITS, TEN = range(4)  # Numeral kinds
+    OPEN_H, OPEN_T, OPEN_D, CLOSED = range(4)  # Group states
+
+    MARK, SKIP = range(4, 6)  # Kinds of thousand marks and deleted characters
+
+    CONFUSABLES = {
+        "а": "α",
+        "в": "Bβ",
+        "г": "rΓ",
+        "є": "ε€",
+        "з": "3",
+        "и": "uUй",
+        "ѳ": "θΘ",
+        "і": "1l|ї",
+        "к": "κ",
+        "л": "λ",
+        "м": "M",
+        "н": "H",
+        "ѯ": "ξΞ",
+        "ѻ": "0οΟ",
+        "п": "nπ",
+        "ч": "4",
+        "р": "ρ",
+        "с": "ϲ",
+        "т": "mTτ",
+        "у": "γ",
+        "ф": "φΦ",
+        "х": "χ",
+        "ѱ": "ψΨ",
+        "ѿ": "ѡω",
+    }  # Characters commonly recognized by OCR instead of numerals
+
+    letters = None  # Numeral values and kinds
+    characters = None  # Numeral values and kinds, by character before normalization
+    alphabet = None  # Translation table deleting numerals and marks
+    # Translation table substituting numerals for confusable characters
+    corrections = None
+    # Translation table normalizing numbers, same as StrConverter.normalizer
+    normalizer = None
+    transitions = None  # Group states after a numeral kind is appended
+    initial = None  # Group states after a group is started by a numeral kind
+    groups = None  # Group totals, by UTF-8 bytes of numerals with or without "titlo"
+    widths = None  # Byte lengths of groups without "titlo", longest first
+    encoded = None  # UTF-8 bytes of thousand mark, "titlo" and delimeter
+
+    byte_pattern = omninumeric.Pattern(
+        lambda cls: "{0}+".format(
+            cls.alternate(
+                cls.dict_.hundreds()
+                + cls.dict_.tens()
+                + cls.dict_.digits()
+                + cls.const.THOUSAND
+                + cls.const.TITLO
+                + cls.const.DELIMETER
+            )
+        ).encode("latin-1")
+    )  # Regular expression for UTF-8 numbers of numerals, marks and decorators only
+
+    @classmethod
+    def buildTables(cls):
+        "Build numeral and group state tables."
+
+        letters = {}
+        for k, kind in (
+            (cls.dict_.hundreds(), cls.HUNDREDS),
+            (cls.dict_.tens(2), cls.TENS),
+            (cls.dict_.digits(), cls.DIGITS),
+            (cls.dict_.get(10), cls.TEN),
+        ):
+            for l in k:
+                letters[l] = (cls.dict_.get(l), kind)
+
+        # (state, kind, thousand marks before numeral) -> next state
+        cls.transitions = {
+            (cls.OPEN_H, cls.TENS, False): cls.OPEN_T,
+            (cls.OPEN_H, cls.TENS, True): cls.OPEN_T,
+            (cls.OPEN_H, cls.DIGITS, False): cls.OPEN_D,
+            (cls.OPEN_H, cls.DIGITS, True): cls.OPEN_D,
+            (cls.OPEN_H, cls.TEN, False): cls.CLOSED,
+            (cls.OPEN_T, cls.DIGITS, False): cls.CLOSED,
+            (cls.OPEN_T, cls.DIGITS, True): cls.CLOSED,
+            (cls.OPEN_D, cls.TEN, False): cls.CLOSED,
+        }
+        cls.initial = (cls.OPEN_H, cls.OPEN_T, cls.OPEN_D, cls.CLOSED)
+        cls.normalizer = StrConverter.normalizer
+        cls.letters = letters
+
+        # Every character the normalizer translates into a single numeral or mark, or deletes, so that parse() normalizes while reading
+        characters = {}
+        for k in set(letters) | {cls.const.THOUSAND} | set(map(chr, cls.normalizer)):
+            l = str.translate(k, cls.normalizer)
+
+            if l == cls.const.THOUSAND:
+                characters[k] = (0, cls.MARK)
+            elif not l:
+                characters[k] = (0, cls.SKIP)
+            elif l in letters:
+                characters[k] = letters[l]
+
+        cls.characters = characters
+
+    @staticmethod
+    def alternate(chars):
+        """
+        Build a regular expression matching any of @chars in UTF-8, to be encoded as Latin-1.
+
+        Characters are grouped by leading bytes, and their last bytes are matched by character sets, which are faster than alternatives.
+        """
+
+        import re
+
+        tails = {}  # Last bytes, by leading bytes
+        for k in chars:
+            k = str(k.encode(), "latin-1")  # One character per byte
+            tails.setdefault(k[:-1], set()).add(k[-1])
+
+        return "(?:{0})".format(
+            "|".join(
+                "{0}[{1}]".format(re.escape(k), "".join(map(re.escape, sorted(v))))
+                for k, v in sorted(tails.items())
+            )
+        )
+
+    @classmethod
+    def buildGroups(cls):
+        """
+        Build group totals table for parseBytes().
+
+        Every group StrConverter.regex accepts without thousand marks is encoded as is and as written with "titlo".
+        """
+
+        if cls.letters is None:
+            cls.buildTables()
+
+        hundreds = [""] + list(cls.dict_.hundreds())
+        tens = [""] + list(cls.dict_.tens(2))
+        digits = [""] + list(cls.dict_.digits())
+        rest = [k + cls.dict_.get(10) for k in digits]
+        rest += [k + l for k in tens for l in digits]
+
+        groups = {}
+        widths = set()
+        for k in hundreds:
+            for l in rest:
+                group = k + l
+                if not group:
+                    continue
+
+                total = sum(cls.letters[i][0] for i in group)
+                groups[group.encode()] = total
+                widths.add(len(group.encode()))
+
+                i = max(len(group) - 1, 1)  # "Titlo" is written before the last numeral
+                groups[(group[:i] + cls.const.TITLO + group[i:]).encode()] = total
+
+        cls.widths = sorted(widths, reverse=True)
+        cls.groups = groups
+        cls.encoded = tuple(
+            k.encode()
+            for k in (cls.const.THOUSAND, cls.const.TITLO, cls.const.DELIMETER)
+        )
+
+    @classmethod
+    def convert(cls, alphabetic, flags=0):
+        "Convert from Cyrillic numeral system."
+
+        result, error = cls.parse(alphabetic, flags)
+        omninumeric.raiseError(error, alphabetic, "Cyrillic")
+        return result
+
+    @classmethod
+    def parse(cls, alphabetic, flags=0):
+        """
+        Convert from Cyrillic numeral system without raising errors.
+
+        Returns a pair of converted number (0 if invalid) and error code.
+        """
+
+        if not isinstance(alphabetic, str):
+            return 0, omninumeric.ERROR_TYPE
+
+        if cls.letters is None:
+            cls.buildTables()
+
+        characters = cls.characters
+        transitions = cls.transitions
+        initial = cls.initial
+        thousand = cls.const.THOUSAND
+        special = cls.TEN  # Kinds above are not numerals
+        mark = cls.MARK
+
+        counts = []  # Leading thousand marks counts, by group
+        totals = []  # Group totals
+        state = cls.CLOSED
+        marks = 0
+
+        for l in str.strip(alphabetic):
+            if l == thousand:  # Checked first, as huge numbers are mostly marks
+                marks += 1
+                continue
+
+            numeral = characters.get(l)
+            if numeral is None:
+                return 0, omninumeric.ERROR_PATTERN
+
+            value, kind = numeral
+
+            if kind > special:
+                if kind == mark:
+                    marks += 1
+                continue
+
+            following = transitions.get((state, kind, marks > 0))
+
+            if following is None:
+                counts.append(marks)
+                totals.append(value)
+                state = initial[kind]
+            else:
+                totals[-1] += value
+                state = following
+
+            marks = 0
+
+        if marks:  # Trailing thousand marks form a group
+            counts.append(marks)
+            totals.append(0)
+
+        return cls.combine(counts, totals)
+
+    @classmethod
+    def combine(cls, counts, totals):
+        """
+        Combine numeral groups read by a parse function into a number.
+
+        @counts - leading thousand marks counts, by group
+        @totals - group totals
+
+        Returns a pair of converted number (0 if invalid) and error code.
+        """
+
+        if not totals:
+            return 0, omninumeric.ERROR_EMPTY
+
+        index = len(totals)
+        if index <= greek.StrConverter.SMALL:  # Small number, sum directly
+            result = 0
+            for i in range(index):
+                k = counts[i]
+                result += totals[i] * pow(1000, k if k else index - i - 1)
+            return result, omninumeric.ERROR_NONE
+
+        exponents = [k if k else index - i - 1 for i, k in enumerate(counts)]
+        groups = [0] * (max(exponents) + 1)
+
+        for i, k in enumerate(exponents):
+            groups[k] += totals[i]
+
+        return greek.StrConverter.combineGroups(groups), omninumeric.ERROR_NONE
+
+    @classmethod
+    def buildCorrections(cls):
+        """
+        Build correction tables for parseFuzzy().
+
+        StrConverter.regex+ accepts any non-empty sequence of numerals and thousand marks, so its automaton has a single state, and the nearest number is found by correcting every other character on its own: substituting a numeral for a confusable character, or deleting it. Both cost a single edit.
+        """
+
+        if cls.letters is None:
+            cls.buildTables()
+
+        cls.alphabet = dict.fromkeys(map(ord, set(cls.letters) | {cls.const.THOUSAND}))
+        cls.corrections = omninumeric.Normalizer.compile(cls.CONFUSABLES)
+
+    @classmethod
+    def parseFuzzy(cls, alphabetic, edits=1):
+        """
+        Convert from Cyrillic numeral system, correcting up to @edits characters, without raising errors.
+
+        Characters which are neither numerals nor marks after normalization are corrected: confusable characters are replaced with numerals, others are deleted.
+        Returns converted number (0 if invalid), count of characters corrected, and error code.
+        """
+
+        if not isinstance(alphabetic, str):
+            return 0, 0, omninumeric.ERROR_TYPE
+
+        if cls.corrections is None:
+            cls.buildCorrections()
+
+        alphabetic = str.translate(str.strip(alphabetic), StrConverter.normalizer)
+        rest = str.translate(alphabetic, cls.alphabet)  # Characters to correct
+
+        if len(rest) > edits:
+            return 0, len(rest), omninumeric.ERROR_PATTERN
+
+        if rest:
+            corrections = cls.corrections
+            alphabetic = str.translate(
+                alphabetic, {ord(k): corrections.get(ord(k)) for k in rest}
+            )
+
+        result, error = cls.parse(alphabetic)
+        if error and rest:  # Nothing left but corrected characters
+            error = omninumeric.ERROR_PATTERN
+
+        return result, len(rest), error
+
+    @classmethod
+    def parseBytes(cls, buf, start=0, end=None):
+        """
+        Convert from Cyrillic numeral system, reading UTF-8 bytes without raising errors.
+
+        @buf - bytes-like object (i.e. bytes, bytearray, memoryview or mmap)
+        @start - offset to start reading at, in bytes
+        @end - offset to stop reading at, in bytes, end of @buf if not set
+
+        Numbers of one or two groups of lowercase numerals, with leading thousand marks, "titlo" and dots, are read as bytes, so that no string is created: group totals are looked up in a table of UTF-8 bytes. A single group as written is found directly once wrapping dots are stripped, other numbers are looked up with decorators deleted. Every prefix of a group is a group, so the first group is the longest prefix found in the table, as in parse().
+        Other numbers, i.e. with marks inside or needing normalization, are decoded and read with parse().
+        Returns a pair of converted number (0 if invalid) and error code.
+        """
+
+        if isinstance(buf, bytes):
+            number = buf[start:end]
+        else:
+            try:
+                view = memoryview(buf).cast("B")  # Offsets are in bytes for any format
+            except TypeError:
+                return 0, omninumeric.ERROR_TYPE
+
+            with view:
+                number = bytes(view[start:end])
+
+        if cls.groups is None:
+            cls.buildGroups()
+
+        groups = cls.groups
+        thousand, titlo, delimeter = cls.encoded
+
+        total = groups.get(number.strip(delimeter))
+        if total is not None:  # Single group as written
+            return total, omninumeric.ERROR_NONE
+
+        key = number.replace(titlo, b"").replace(delimeter, b"")
+        # Strips whole marks: no numeral starts with their bytes
+        rest = key.lstrip(thousand)
+        marks = (len(key) - len(rest)) // len(thousand)
+
+        for i in cls.widths:
+            first = groups.get(rest[:i])
+            if first is not None:
+                if not rest[i:]:
+                    result = first * pow(1000, marks)
+                else:  # Second group is units, marked or not
+                    second = groups.get(rest[i:])
+                    if second is None:
+                        break
+                    result = first * pow(1000, marks or 1) + second
+
+                # Deleted decorators must not have split characters
+                if cls.byte_pattern.fullmatch(number):
+                    return result, omninumeric.ERROR_NONE
+                break
+
+        try:
+            alphabetic = str(number, "utf-8")
+        except UnicodeDecodeError:
+            return 0, omninumeric.ERROR_PATTERN
+
+        return cls.parse(alphabetic)
+
+
+@total_ordering
+class Numeral:
+    """
+    Immutable Cyrillic numeral system number.
+
+    The number is read on first use and its value is cached, so that numbers can be compared, sorted, deduplicated and used as dict keys without reading them again. Numbers compare and hash equal to their int values.
+
+    @source - number in Cyrillic numeral system
+    """
+
+    __slots__ = ("source", "_value", "_rendered")
+
+    def __init__(self, source):
+        omninumeric.isinstanceEx(source, str, "String required, got {0}")
+
+        object.__setattr__(self, "source", source)
+        object.__setattr__(self, "_value", None)
+        object.__setattr__(self, "_rendered", None)  # Renderings, by flags
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Numeral is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("Numeral is immutable")
+
+    def __reduce__(self):
+        return Numeral, (self.source,)
+
+    def __int__(self):
+        value = self._value
+
+        if value is None:
+            value = StateConverter.convert(self.source)
+            object.__setattr__(self, "_value", value)
+
+        return value
+
+    def render(self, flags=0):
+        "Write the number in given style. Renderings are cached per flags combination."
+
+        rendered = self._rendered
+
+        if rendered is None:
+            rendered = {}
+            object.__setattr__(self, "_rendered", rendered)
+
+        if flags not in rendered:
+            rendered[flags] = TableConverter.compile(flags)(int(self))
+
+        return rendered[flags]
+
+    def __hash__(self):
+        return hash(int(self))
+
+    def __eq__(self, other):
+        value = self._value if self._value is not None else int(self)
+
+        if isinstance(other, Numeral):
+            return value == (other._value if other._value is not None else int(other))
+        if isinstance(other, int):
+            return value == other
+
+        return NotImplemented
+
+    def __lt__(self, other):
+        value = self._value if self._value is not None else int(self)
+
+        if isinstance(other, Numeral):
+            return value < (other._value if other._value is not None else int(other))
+        if isinstance(other, int):
+            return value < other
+
+        return NotImplemented
+
+    def __str__(self):
+        return self.source
+
+    def __repr__(self):
+        return "Numeral({0!r})".format(self.source)
+
+
+@cache.cached("cyrillic", "write")
+@table.tabled("cyrillic", "write")
 def write(number, flags=0):
     """
     Convert into Cyrillic numeral system. Uses plain style by default.
@@ -217,9 +1148,104 @@ def write(number, flags=0):
     Requires a non-zero integer.
     """
 
-    return IntConverter(number, flags).convert()
+    return TableConverter.compile(flags)(number)
 
 
+def sequence(start, stop, flags=0):
+    """
+    Generate numbers in Cyrillic numeral system for a range of values, same as write() for every value.
+
+    @start - first value, a natural number
+    @stop - value to stop before
+    @flags - conversion flags
+
+    Numbers are stepped incrementally instead of being written from scratch.
+    """
+
+    omninumeric.isinstanceEx(start, int, "Integer required, got {0}")
+    omninumeric.isinstanceEx(stop, int, "Integer required, got {0}")
+    if start <= 0 and stop > start:
+        raise ValueError("Natural number required")
+
+    return TableConverter.sequence(start, stop, flags)
+
+
+def compile_writer(flags=0):
+    """
+    Get a converter function into Cyrillic numeral system for given flags.
+
+    Flags are resolved once, and functions are cached per flags combination, so that writing many numbers in the same style does not check flags for every number.
+    """
+
+    return TableConverter.compile(flags)
+
+
+def write_into(buf, number, flags=0):
+    """
+    Convert into Cyrillic numeral system, writing into a buffer. Uses plain style by default.
+
+    @buf - list, or any object with write() method (i.e. io.StringIO or text file)
+    @number - non-zero integer to convert
+    @flags - writing style flags
+
+    Glyphs are written into @buf piece by piece, without building the number as a string.
+    """
+
+    TableConverter.compileInto(flags)(number, omninumeric.getSink(buf))
+
+
+def write_lines(values, out, flags=0):
+    """
+    Convert numbers into Cyrillic numeral system, writing them into a buffer one per line. Uses plain style by default.
+
+    @values - any iterable of non-zero integers
+    @out - list, or any object with write() method (i.e. io.StringIO or text file)
+    @flags - writing style flags
+    """
+
+    convert = TableConverter.compileInto(flags)
+    write = omninumeric.getSink(out)
+
+    for k in values:
+        convert(k, write)
+        write("\n")
+
+
+def write_many(values, flags=0):
+    """
+    Convert a batch of numbers into Cyrillic numeral system. Uses plain style by default.
+
+    @values - NumPy integer array or any iterable of non-zero integers
+    @flags - writing style flags
+
+    Returns NumPy object array of the same shape for NumPy arrays, list otherwise.
+    """
+
+    numpy = omninumeric.getNumpy()
+
+    if numpy is not None and isinstance(values, numpy.ndarray):
+        if values.dtype.kind in "iu":
+            return TableConverter.convertArray(values, flags)
+
+        result = numpy.empty(values.shape, dtype=object)
+        result.flat = write_many(values.ravel().tolist(), flags)
+        return result
+
+    values = list(values)
+
+    if numpy is not None and all(type(k) is int for k in values):
+        try:
+            array = numpy.array(values, dtype=numpy.int64)
+        except OverflowError:  # Numbers too big for vectorized conversion
+            pass
+        else:
+            return TableConverter.convertArray(array, flags).tolist()
+
+    return [TableConverter.convert(k, flags) for k in values]
+
+
+@cache.cached("cyrillic", "read")
+@table.tabled("cyrillic", "read")
 def read(number, flags=0):
     """
     Convert from Cyrillic numeral system.
@@ -227,4 +1253,112 @@ def read(number, flags=0):
     Requires a non-empty string.
     """
 
-    return StrConverter(number, flags).convert()
+    return StateConverter.convert(number, flags)
+
+
+def read_bytes(buf, start=0, end=None):
+    """
+    Convert from Cyrillic numeral system, reading UTF-8 bytes.
+
+    @buf - bytes-like object (i.e. bytes, bytearray, memoryview or mmap)
+    @start - offset to start reading at, in bytes
+    @end - offset to stop reading at, in bytes, end of @buf if not set
+
+    Numbers as written are read by table lookup of UTF-8 bytes, without decoding them, and only the slice read is copied. Accepts the same numbers as read().
+    """
+
+    result, error = StateConverter.parseBytes(buf, start, end)
+
+    if error == omninumeric.ERROR_TYPE:
+        raise TypeError("Bytes-like object required, got {0}".format(type(buf)))
+    omninumeric.raiseError(error, buf, "Cyrillic")
+
+    return result
+
+
+def read_fuzzy(number, max_edits=1):
+    """
+    Convert from Cyrillic numeral system, tolerating OCR errors.
+
+    @number - number to convert
+    @max_edits - maximum count of characters to correct
+
+    Characters which are not numerals are replaced with numerals they are commonly confused with (i.e. "3" with "з"), or deleted.
+    Returns a pair of the value of the nearest number and the count of characters corrected.
+    """
+
+    result, distance, error = StateConverter.parseFuzzy(number, max_edits)
+
+    if error == omninumeric.ERROR_PATTERN:
+        raise ValueError(
+            "String does not match any pattern for Cyrillic numeral system numbers within {0} edits".format(
+                max_edits
+            )
+        )
+    omninumeric.raiseError(error, number, "Cyrillic")
+
+    return result, distance
+
+
+def read_many(values, flags=0):
+    """
+    Convert a batch of numbers from Cyrillic numeral system.
+
+    @values - any iterable of non-empty strings
+
+    Returns NumPy int64 array (object array of ints if any of the numbers overflows int64) if NumPy is installed, list otherwise.
+    """
+
+    return omninumeric.intArray([StateConverter.convert(k, flags) for k in values])
+
+
+def scan(stream, flags=0, chunksize=omninumeric.CHUNKSIZE):
+    """
+    Find and convert Cyrillic numeral system numbers in a text stream.
+
+    @stream - text file object, read in chunks
+    @flags - NOTITLO to find numbers without "titlo" decorator as well
+    @chunksize - count of characters to read at once
+
+    Yields offset, length, raw token and converted number for every number found.
+    """
+
+    regex = (
+        StrConverter.notitlo_token_pattern
+        if flags & NOTITLO
+        else StrConverter.token_pattern
+    )
+
+    return omninumeric.scanStream(
+        stream, regex, StrConverter.tokenCharset(), StateConverter.parse, chunksize
+    )
+
+
+def try_read(number, default=None):
+    """
+    Convert from Cyrillic numeral system without raising errors.
+
+    Returns @default if the number is invalid.
+    """
+
+    result, error = StateConverter.parse(number)
+    return default if error else result
+
+
+def try_read_many(values, errors=False):
+    """
+    Convert a batch of numbers from Cyrillic numeral system without raising errors.
+
+    @values - any iterable of strings
+    @errors - return error codes as well
+
+    Returns converted numbers (0 for invalid ones) and validity mask, followed by error codes if @errors is set.
+    NumPy arrays are returned if NumPy is installed, lists otherwise.
+    """
+
+    return omninumeric.parseMany(StateConverter.parse, values, errors)
+
+
+omninumeric.registerDetector(
+    "cyrillic", StrConverter.detection_regex, StateConverter.parse
+)
@@ -0,0 +1,176 @@
+# -*- coding: UTF-8 -*-
+# For licensing information see LICENSE file included in the project's root directory.
+"""
+This module provides tools for indexing Cyrillic numeral system numbers in UTF-8 corpora.
+
+A corpus is memory-mapped and scanned as bytes. Numbers found are stored in an index file: an array of native unsigned 64-bit integer pairs (value, byte offset), sorted by value. Index is memory-mapped as well, and queried by binary search.
+"""
+
+__all__ = ["annotate", "Index"]
+
+
+import mmap, re
+from array import array
+from omninumeric.cyrillic import cyrillic
+
+
+def compileRun(flags=0):
+    """
+    Compile a bytes regular expression for runs of UTF-8 encoded characters Cyrillic numeral system numbers in text consist of.
+
+    Runs are maximal, and contain "titlo" decorator unless NOTITLO flag is set.
+    """
+
+    tails = {}  # Last bytes of encoded characters, by leading bytes
+    for k in cyrillic.StrConverter.tokenCharset():
+        k = k.encode()
+        tails.setdefault(k[:-1], set()).add(k[-1:])
+
+    char = (
+        b"(?:"
+        + b"|".join(
+            re.escape(k) + b"[" + b"".join(re.escape(i) for i in sorted(v)) + b"]"
+            for k, v in sorted(tails.items())
+        )
+        + b")"
+    )
+
+    if flags & cyrillic.NOTITLO:
+        return re.compile(char + b"+")
+
+    titlo = re.escape(cyrillic.Const.TITLO.encode())
+    return re.compile(char + b"*" + titlo + char + b"*")
+
+
+def getNeighbours(source, start, end):
+    "Decode characters before and after @source[@start:@end], empty strings at the edges."
+
+    i = start - 1
+    while i > 0 and start - i < 4 and 0x80 <= source[i] < 0xC0:  # Continuation byte
+        i -= 1
+    before = source[max(i, 0) : start].decode("utf-8", "replace")[-1:]
+    after = source[end : end + 4].decode("utf-8", "replace")[:1]
+
+    return before, after
+
+
+def annotate(corpus, index, flags=0):
+    """
+    Index Cyrillic numeral system numbers in a UTF-8 corpus.
+
+    @corpus - path to corpus file
+    @index - path to index file to write
+    @flags - NOTITLO to index numbers without "titlo" decorator as well
+
+    Finds the same numbers as cyrillic.scan(): runs of numeral characters are found in bytes, then decoded along with their neighbours and matched against the token pattern.
+    Numbers too big for unsigned 64-bit integers are not indexed.
+    Returns count of numbers indexed.
+    """
+
+    run = compileRun(flags)
+    regex = (
+        cyrillic.StrConverter.notitlo_token_pattern
+        if flags & cyrillic.NOTITLO
+        else cyrillic.StrConverter.token_pattern
+    )
+    found = []
+
+    with open(corpus, "rb") as f:
+        try:
+            source = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # Empty file can not be mapped
+            source = b""
+
+        try:
+            for k in run.finditer(source):
+                before, after = getNeighbours(source, k.start(), k.end())
+                text = before + k.group().decode() + after
+
+                for i in regex.finditer(text):
+                    value, error = cyrillic.StateConverter.parse(i.group())
+                    if not error and value < 1 << 64:
+                        offset = text[len(before) : i.start()].encode()
+                        found.append((value, k.start() + len(offset)))
+        finally:
+            if isinstance(source, mmap.mmap):
+                source.close()
+
+    found.sort()
+    result = array("Q")
+    for k in found:
+        result.extend(k)
+
+    with open(index, "wb") as f:
+        result.tofile(f)
+
+    return len(found)
+
+
+class Index:
+    """
+    Memory-mapped index of Cyrillic numeral system numbers in a corpus.
+
+    Use annotate() to create index files.
+    """
+
+    def __init__(self, path):
+        self.file = open(path, "rb")
+
+        try:
+            self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.records = memoryview(self.map).cast("Q")
+        except ValueError:  # Empty index
+            self.map = None
+            self.records = array("Q")
+
+    def __len__(self):
+        return len(self.records) // 2
+
+    def __getitem__(self, i):
+        "Get byte offset and value of a number."
+
+        if not -len(self) <= i < len(self):
+            raise IndexError("Index out of range")
+
+        i = i % len(self)
+        return self.records[2 * i + 1], self.records[2 * i]
+
+    def bisect(self, value):
+        "Find position of the first number not less than @value."
+
+        low, high = 0, len(self)
+
+        while low < high:
+            middle = (low + high) // 2
+            if self.records[2 * middle] < value:
+                low = middle + 1
+            else:
+                high = middle
+
+        return low
+
+    def query(self, start, stop=None):
+        """
+        Find numbers in a range of values.
+
+        @start - lowest value
+        @stop - highest value (inclusive), equals to @start if not set
+
+        Returns a list of byte offset and value pairs, sorted by value and offset.
+        """
+
+        stop = start if stop is None else stop
+        return [self[i] for i in range(self.bisect(start), self.bisect(stop + 1))]
+
+    def close(self):
+        if isinstance(self.records, memoryview):
+            self.records.release()
+        if self.map is not None:
+            self.map.close()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
@@ -2,7 +2,7 @@
 # For licensing information see LICENSE file included in the project's root directory.
 "This module provides basic tools for reading and writing numbers in Greek-type alphabetic numeral systems."
 
-import re, omninumeric
+import omninumeric
 
 
 PLAIN = 0  # Write in plain style flag
@@ -26,10 +26,27 @@ class Dictionary(omninumeric.Dictionary):
         step - numeral value increment (i.e. 1 for range of 1, 2, 3...; 10 for range of 10, 20, 30...)
         """
 
-        r = ""
-        for i in range(start * step, (end + 1) * step, step):
-            r += cls(i).name
-        return r
+        key = (start, end, step)
+
+        try:
+            return cls._ranges[key]
+        except (AttributeError, KeyError):
+            pass
+
+        glyphs = cls.glyphs()
+        try:
+            result = "".join(
+                glyphs[i] for i in range(start * step, (end + 1) * step, step)
+            )
+        except KeyError as e:  # Same error as for Enum lookup by value
+            raise ValueError(
+                "{0!r} is not a valid {1}".format(e.args[0], cls.__qualname__)
+            )
+
+        if "_ranges" not in cls.__dict__:
+            setattr(cls, "_ranges", {})  # Numeral ranges, by start, end and step
+        cls._ranges[key] = result
+        return result
 
     @classmethod
     def digits(cls, start=1, end=9):
@@ -69,6 +86,10 @@ class IntConverter(omninumeric.IntConverter):
     Derive from this class to define converters into Greek-type alphabetic numeral systems.
     """
 
+    __slots__ = ()
+
+    SMALL = 1024  # Maximum bit length of a number divided into groups directly
+
     def appendThousandMarks(self, cond, thousand):
         "Append thousand marks according to chosen style (plain or delimeter)."
 
@@ -91,31 +112,66 @@ class IntConverter(omninumeric.IntConverter):
     def translateGroups(self):
         "Translate groups of numerals one by one."
 
-        for i, k in enumerate(self.groups):
-
-            result = ""
-            index = 0
+        glyphs = self.dict_.glyphs()
 
-            while k > 0:
-                result = "{0}{1}".format(
-                    self.getNumeral(k % 10 * pow(10, index)), result
+        for i, k in enumerate(self.groups):
+            self.groups[i] = "".join(
+                (
+                    glyphs.get(k // 100 * 100, ""),
+                    glyphs.get(k // 10 % 10 * 10, ""),
+                    glyphs.get(k % 10, ""),
                 )
-                index = index + 1
-                k = k // 10
-
-            self.groups[i] = result
+            )  # Groups are less than 1000
 
         return self
 
     def breakIntoGroups(self):
         "Break source number into groups of 3 numerals."
 
-        while self.source > 0:
-            self.groups.append(self.source % 1000)
-            self.source = self.source // 1000
+        self.groups.extend(self.splitGroups(self.source))
+        self.source = 0
 
         return self
 
+    @staticmethod
+    def splitGroups(number):
+        """
+        Break a number into groups of 3 numerals, lowest first.
+
+        Huge numbers are split in halves on powers of 1000 recursively, instead of dividing the whole number by 1000 for every group.
+        """
+
+        groups = []
+
+        if number.bit_length() <= IntConverter.SMALL:  # Small number, divide directly
+            while number > 0:
+                groups.append(number % 1000)
+                number = number // 1000
+            return groups
+
+        powers = [1000]  # Powers of 1000 to the powers of 2
+        while powers[-1] * powers[-1] <= number:
+            powers.append(powers[-1] * powers[-1])
+
+        def split(number, index, pad):
+            # Break @number less than powers[index] ** 2 into groups, padding to 2 ** (index + 1) groups if @pad is set
+            if index < 4:
+                count = len(groups)
+                while number > 0:
+                    groups.append(number % 1000)
+                    number = number // 1000
+                if pad:
+                    groups.extend([0] * (count + (2 << index) - len(groups)))
+                return
+
+            high, low = divmod(number, powers[index])
+            split(low, index - 1, pad or high > 0)
+            if high or pad:
+                split(high, index - 1, pad)
+
+        split(number, len(powers) - 1, False)
+        return groups
+
 
 class StrConverter(omninumeric.StrConverter):
     """
@@ -124,19 +180,16 @@ class StrConverter(omninumeric.StrConverter):
     Derive from this class to define converters from Greek-type alphabetic numeral systems.
     """
 
-    def prepare(self):
+    __slots__ = ()
 
-        super().prepare()
-        self.source = str.lower(self.source)
-        return self
+    SMALL = 32  # Maximum count of groups combined directly
 
     @classmethod
     def calculateMultiplier(cls, index, group, thousand):
         'Calculate multiplier for a numerals group, according to group index or "thousand" marks present in the group.'
 
-        multiplier = (
-            re.match("({0}*)".format(thousand), group).groups()[0].count(thousand)
-        )  # Count trailing thousand marks in the group
+        multiplier = len(group) - len(group.lstrip(thousand))
+        # Count trailing thousand marks in the group
         multiplier = pow(1000, multiplier if multiplier else index)
         # Use thousand marks if present, otherwise use group index
         return multiplier
@@ -144,22 +197,54 @@ class StrConverter(omninumeric.StrConverter):
     def translateGroups(self, thousand):
         "Translate groups of numerals one by one."
 
+        values = self.dict_.values()
+
         for i, k in enumerate(self.groups):
             total = 0  # Current group total value
             multiplier = self.calculateMultiplier(i, k)
-            k = re.sub(thousand, "", k)  # Strip thousand marks
+            k = k.replace(thousand, "")  # Strip thousand marks
 
             for l in k:
-                total += self.getNumeral(l)
+                total += values.get(l, 0)
 
             self.groups[i] = total * multiplier
 
         return self
 
-    def breakIntoGroups(self, regex=""):
-        "Break source number in groups of 1-3 numerals."
+    @staticmethod
+    def combineGroups(groups):
+        """
+        Sum group values multiplied by powers of 1000 by group index.
+
+        Huge sums are combined in halves recursively, so that every multiplication is done on numbers of similar size.
+        """
+
+        powers = {}  # Powers of 1000, by exponent
+
+        def combine(start, end):
+            if end - start <= StrConverter.SMALL:
+                result = 0
+                for i in range(end - 1, start - 1, -1):
+                    result = result * 1000 + groups[i]
+                return result
+
+            half = 1 << ((end - start - 1).bit_length() - 1)
+            if half not in powers:
+                powers[half] = pow(1000, half)
+
+            low = combine(start, start + half)
+            return low + combine(start + half, end) * powers[half]
+
+        return combine(0, len(groups))
+
+    def breakIntoGroups(self, pattern):
+        """
+        Break source number in groups of 1-3 numerals.
+
+        @pattern - compiled regular expression for a numerals group, see omninumeric.Pattern
+        """
 
-        self.groups = re.split(regex, self.source)  # Break into groups
+        self.groups = pattern.split(self.source)  # Break into groups
         self.groups.reverse()  # Reverse groups (to ascending order)
 
         return self
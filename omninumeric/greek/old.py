@@ -55,6 +55,8 @@ class Dictionary(greek.Dictionary):
 class IntConverter(greek.IntConverter):
     "Number converter into Old Greek numeral system."
 
+    __slots__ = ()
+
     def convert(self):
         """
         Convert into Old Greek numeral system. Uses plain style by default.
@@ -74,6 +76,8 @@ class IntConverter(greek.IntConverter):
 class StrConverter(greek.StrConverter):
     "Number converter from Old Greek numeral system."
 
+    __slots__ = ()
+
     dict = Dictionary
 
     def convert(self):
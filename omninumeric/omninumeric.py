@@ -2,8 +2,11 @@
 # For licensing information see LICENSE file included in the project's root directory.
 "This module provides basic tools for reading and writing numbers in alphabetic numeral systems."
 
-import re
+import time
+from collections import Counter
 from enum import Enum, unique
+from functools import partial, wraps
+from types import MappingProxyType
 
 
 def isinstanceEx(value, cond, msg=""):
@@ -20,6 +23,305 @@ def isinstanceEx(value, cond, msg=""):
         raise TypeError(msg.format(t))
 
 
+ERROR_NONE = 0  # Number is valid
+ERROR_TYPE = 1  # Number is of a wrong type
+ERROR_EMPTY = 2  # Number is empty
+ERROR_PATTERN = 3  # Number does not match any pattern for the numeral system
+
+
+def raiseError(error, source, system):
+    """
+    Raise the error StrConverter.convert() raises for an error code returned by a parse function.
+
+    @error - error code
+    @source - number being converted
+    @system - numeral system name for error message (i.e. "Cyrillic")
+    """
+
+    if error == ERROR_TYPE:
+        raise TypeError("String required, got {0}".format(type(source)))
+    if error == ERROR_EMPTY:
+        raise ValueError("Non-empty string required")
+    if error:
+        raise ValueError(
+            "String does not match any pattern for {0} numeral system numbers".format(
+                system
+            )
+        )
+
+
+def getSink(buf):
+    """
+    Get a function writing strings into a buffer.
+
+    @buf - list, or any object with write() method (i.e. io.StringIO or text file)
+    """
+
+    try:
+        return buf.write
+    except AttributeError:
+        return buf.append
+
+
+CHUNKSIZE = 1 << 16  # Default count of characters read from a stream at once
+
+_numpy = NotImplemented  # NumPy module, imported on first use
+
+
+def getNumpy():
+    """
+    Import NumPy on first use.
+
+    Returns NumPy module, or None if NumPy is not installed.
+    """
+
+    global _numpy
+
+    if _numpy is NotImplemented:
+        try:
+            import numpy as _numpy
+        except ImportError:
+            _numpy = None
+
+    return _numpy
+
+
+def intArray(values):
+    """
+    Pack a list of integers into NumPy int64 array.
+
+    Returns object array of ints if any of the numbers overflows int64, or the list itself if NumPy is not installed.
+    """
+
+    numpy = getNumpy()
+
+    if numpy is None:
+        return values
+
+    try:
+        return numpy.array(values, dtype=numpy.int64)
+    except OverflowError:
+        return numpy.array(values, dtype=object)
+
+
+def parseMany(parse, values, errors=False):
+    """
+    Convert a batch of numbers without raising errors for invalid ones.
+
+    @parse - function returning a pair of converted number and error code for a single number
+    @values - any iterable of numbers to convert
+    @errors - return error codes as well
+
+    Returns converted numbers (0 for invalid ones) and validity mask, followed by error codes if @errors is set.
+    NumPy arrays are returned if NumPy is installed, lists otherwise.
+    """
+
+    result, codes = [], []
+    for k in values:
+        k, code = parse(k)
+        result.append(k)
+        codes.append(code)
+
+    numpy = getNumpy()
+    result = intArray(result)
+
+    if numpy is None:
+        mask = [not k for k in codes]
+    else:
+        codes = numpy.array(codes, dtype=numpy.uint8)
+        mask = codes == ERROR_NONE
+
+    return (result, mask, codes) if errors else (result, mask)
+
+
+def scanStream(stream, regex, charset, parse, chunksize=CHUNKSIZE):
+    """
+    Find and convert numbers in a text stream, reading it in chunks.
+
+    @stream - text file object
+    @regex - compiled regular expression matching a single number token
+    @charset - characters a number token may consist of
+    @parse - function returning a pair of converted number and error code for a single number
+    @chunksize - count of characters to read at once
+
+    Yields offset, length, raw token and converted number for every valid number token.
+    Tokens spanning chunk boundaries are held back until the chunk that completes them is read.
+    """
+
+    buffer = ""
+    base = 0  # Offset of buffer start in the stream
+    pos = 0  # Position in buffer to continue scanning from
+
+    while True:
+        chunk = stream.read(chunksize)
+        buffer += chunk
+        end = len(buffer)
+
+        if chunk:
+            while end > pos and buffer[end - 1] in charset:
+                end -= 1  # Hold back a trailing run that may continue in the next chunk
+
+        for k in regex.finditer(buffer, pos, end):
+            value, error = parse(k.group())
+            if not error:
+                yield base + k.start(), k.end() - k.start(), k.group(), value
+
+        if not chunk:
+            return
+
+        # Keep a character before the held back run for lookbehind
+        keep = max(end - 1, 0)
+        buffer = buffer[keep:]
+        base += keep
+        pos = end - keep
+
+
+DETECTED = ("cyrillic", "roman")  # Numeral systems detected by default
+
+detectors = {}  # Token regular expressions and parse functions, by numeral system name
+detection = {}  # Combined patterns and parse functions, by numeral system names
+
+
+def registerDetector(system, regex, parse):
+    """
+    Register a numeral system for detect_iter() and detect_and_read(). Numeral system modules register themselves when imported.
+
+    @system - numeral system name, a valid identifier
+    @regex - regular expression matching a single number token, without inline flags: they can not be scoped before Python 3.6, so write case variants out instead
+    @parse - function returning a pair of converted number and error code for a single number
+    """
+
+    detectors[system] = (regex, parse)
+    detection.clear()
+
+
+def getDetection(systems):
+    """
+    Get combined pattern for numeral systems, and parse functions by numeral system name.
+
+    Numeral systems of this package are imported if they are not registered yet.
+    """
+
+    if systems in detection:
+        return detection[systems]
+
+    import re  # Imported on first use, like in Pattern, to keep read() and write() free of it
+
+    for k in systems:
+        if k not in detectors:
+            try:
+                __import__("omninumeric." + k)
+            except ImportError:
+                pass
+        if k not in detectors:
+            raise ValueError("Unknown numeral system: {0}".format(k))
+
+    pattern = re.compile(
+        "|".join("(?P<{0}>{1})".format(k, detectors[k][0]) for k in systems)
+    )  # Every match closes its numeral system group last, so it is the match lastgroup
+    result = detection[systems] = pattern, {k: detectors[k][1] for k in systems}
+    return result
+
+
+def detect_iter(text, systems=DETECTED):
+    """
+    Find numbers of several numeral systems in text, and read them.
+
+    @text - string to search
+    @systems - names of numeral systems to look for, earlier ones take precedence for tokens valid in several systems
+
+    Text is scanned in a single pass with one pattern combining number tokens of all numeral systems.
+    Yields numeral system name, converted number and span of the number in @text for every number found.
+    """
+
+    pattern, parsers = getDetection(tuple(systems))
+
+    for k in pattern.finditer(text):
+        system = k.lastgroup
+        value, error = parsers[system](k.group())
+        if not error:
+            yield system, value, k.span()
+
+
+def detect_and_read(text, systems=DETECTED):
+    """
+    Find numbers of several numeral systems in text, and read them. See detect_iter().
+
+    Returns a list of triples of numeral system name, converted number and span of the number in @text.
+    """
+
+    return list(detect_iter(text, systems))
+
+
+class Pattern:
+    """
+    Regular expression compiled on first use.
+
+    Use as a converter class attribute. Compiled patterns are cached per class, so that a subclass overriding the regular expression gets its own pattern. The re module is not imported until a pattern is used.
+
+    @build - function of converter class returning regular expression string
+    """
+
+    def __init__(self, build):
+        self.build = build
+        self.compiled = {}  # Compiled patterns, by converter class
+
+    def __get__(self, instance, owner):
+        try:
+            return self.compiled[owner]
+        except KeyError:
+            import re
+
+            pattern = self.compiled[owner] = re.compile(self.build(owner))
+            return pattern
+
+
+class Normalizer:
+    """
+    Translation table for str.translate(), built on first use, normalizing numbers before conversion in a single pass.
+
+    Use as a converter class attribute, like Pattern. Tables are cached per class, so that a subclass overriding equivalence classes gets its own table.
+
+    @build - function of converter class returning equivalence classes: map of canonical strings to strings of characters equivalent to them. Characters equivalent to "" are deleted
+    """
+
+    def __init__(self, build):
+        self.build = build
+        self.tables = {}  # Translation tables, by converter class
+
+    def __get__(self, instance, owner):
+        try:
+            return self.tables[owner]
+        except KeyError:
+            table = self.tables[owner] = self.compile(self.build(owner))
+            return table
+
+    @staticmethod
+    def compile(equivalents):
+        "Build translation table for equivalence classes."
+
+        table = {}
+
+        for canonical, k in equivalents.items():
+            for l in k:
+                table[ord(l)] = canonical or None
+
+        return table
+
+    @staticmethod
+    def caseVariants(string):
+        "Get other case variants of characters in a string, which are single characters as well."
+
+        result = []
+
+        for k in string:
+            for l in (k.lower(), k.upper(), k.title()):
+                if len(l) == 1 and l != k and l not in result:
+                    result.append(l)
+
+        return "".join(result)
+
+
 @unique
 class Dictionary(Enum):
     """
@@ -28,6 +330,46 @@ class Dictionary(Enum):
     Derive from this class to define numeral dictionaries for alphabetic numeral systems.
     """
 
+    @classmethod
+    def buildMaps(cls):
+        """
+        Build frozen numeral maps once per dictionary. Returns the map used by get().
+
+        Maps are stored as class attributes, not members. They are stored only for dictionaries with members, which can not be subclassed, so they are never inherited.
+        """
+
+        values = {k: v.value for k, v in cls.__members__.items()}
+        glyphs = {k.value: k.name for k in cls}
+        lookup = dict(values)
+        lookup.update(glyphs)  # Glyphs are str and values are int, so keys do not clash
+
+        if lookup:
+            setattr(cls, "_values", MappingProxyType(values))
+            setattr(cls, "_glyphs", MappingProxyType(glyphs))
+            setattr(cls, "_lookup", lookup)
+
+        return lookup
+
+    @classmethod
+    def values(cls):
+        "Get a frozen map of numeral values by glyph."
+
+        try:
+            return cls._values
+        except AttributeError:
+            cls.buildMaps()
+            return cls.__dict__.get("_values", MappingProxyType({}))
+
+    @classmethod
+    def glyphs(cls):
+        "Get a frozen map of glyphs by numeral value."
+
+        try:
+            return cls._glyphs
+        except AttributeError:
+            cls.buildMaps()
+            return cls.__dict__.get("_glyphs", MappingProxyType({}))
+
     @classmethod
     def get(cls, numeral):
         """
@@ -37,12 +379,117 @@ class Dictionary(Enum):
         """
 
         try:
-            return cls[numeral].value
-        except:
+            lookup = cls._lookup
+        except AttributeError:
+            lookup = cls.buildMaps()
+
+        try:
+            return lookup.get(numeral)
+        except TypeError:  # Unhashable numeral
+            return None
+
+
+class Instrumentation:
+    """
+    Per-stage statistics of number converter pipelines.
+
+    @callback - function called after every stage with converter name, stage name, elapsed time in seconds and converter object
+    """
+
+    def __init__(self, callback=None):
+        import threading  # Imported on first use to keep package import fast
+
+        self.callback = callback
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.stages = {}  # Call counts and total time, by converter and stage name
+        self.sizes = {}  # Source number sizes distribution, by converter name
+
+    @staticmethod
+    def sizeOf(source):
+        "Get source number size: bit length for int, length otherwise."
+
+        if isinstance(source, int):
+            return source.bit_length()
+
+        try:
+            return len(source)
+        except TypeError:
+            return 0
+
+    def wrap(self, function, stage):
+        """
+        Wrap a pipeline stage method to record its statistics.
+
+        @function - method, or function of a classmethod taking the number to convert as its first argument
+        """
+
+        @wraps(function)
+        def wrapper(converter, *args, **kwargs):
+            active = self.local.__dict__.setdefault("active", set())
+
+            if stage in active:  # Stage calls its base class implementation
+                return function(converter, *args, **kwargs)
+
+            owner = converter if isinstance(converter, type) else type(converter)
+            name = "{0}.{1}".format(owner.__module__.rsplit(".", 1)[-1], owner.__name__)
+            if stage == "convert":
+                size = self.sizeOf(args[0] if owner is converter else converter.source)
+                with self.lock:
+                    self.sizes.setdefault(name, Counter())[size] += 1
+
+            active.add(stage)
+            start = time.perf_counter()
             try:
-                return cls(numeral).name
-            except:
-                return None
+                return function(converter, *args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                active.discard(stage)
+
+                with self.lock:
+                    k = self.stages.setdefault((name, stage), [0, 0.0])
+                    k[0] += 1
+                    k[1] += elapsed
+
+                if self.callback is not None:
+                    self.callback(name, stage, elapsed, converter)
+
+        wrapper.stage = stage
+        return wrapper
+
+    def bind(self, function, owner, stage):
+        """
+        Wrap a compiled converter function to record its statistics as a stage method of a converter class.
+
+        @function - function taking the number to convert as its first argument
+        @owner - converter class
+        """
+
+        def method(converter, *args, **kwargs):
+            return function(*args, **kwargs)
+
+        return partial(self.wrap(method, stage), owner)
+
+    def snapshot(self):
+        """
+        Get statistics recorded.
+
+        Returns a dict of "stages": {"converter.stage": {"calls": count, "time": total seconds}} and "sizes": {"converter": {size: count}}.
+        """
+
+        with self.lock:
+            return {
+                "stages": {
+                    "{0}.{1}".format(*k): {"calls": v[0], "time": v[1]}
+                    for k, v in self.stages.items()
+                },
+                "sizes": {k: dict(v) for k, v in self.sizes.items()},
+            }
+
+    def reset(self):
+        with self.lock:
+            self.stages.clear()
+            self.sizes.clear()
 
 
 class NumberConverter:
@@ -52,9 +499,125 @@ class NumberConverter:
     Derive from this class to define converters into and from alphabetic numeral systems.
     """
 
+    __slots__ = ("source", "target", "flags", "groups")
+
     dict_ = NotImplemented
     const = NotImplemented
 
+    stages = (
+        "convert",
+        "validate",
+        "prepare",
+        "breakIntoGroups",
+        "ambiguityCheck",
+        "translateGroups",
+        "appendThousandMarks",
+        "purgeEmptyGroups",
+        "swapDigits",
+        "delimDots",
+        "build",
+        "appendTitlo",
+        "wrapDot",
+        "write",
+        "parse",
+        "parseBytes",
+        "parseFuzzy",
+        "convertArray",
+    )  # Pipeline stage methods recorded by instrumentation
+    converters = []  # Registered converters not derived from NumberConverter
+    instrumentation = None  # Active instrumentation, None if it is off
+
+    @classmethod
+    def register(cls, converter):
+        """
+        Register a converter class not derived from NumberConverter (i.e. a table or state machine converter) for instrumentation. Returns the class, so that it can be used as a class decorator.
+
+        Its stage methods are classmethods taking the number to convert as their first argument.
+        """
+
+        NumberConverter.converters.append(converter)
+        return converter
+
+    @classmethod
+    def classes(cls):
+        "Get converter classes to instrument: all classes derived from NumberConverter and registered ones."
+
+        result = list(NumberConverter.converters)
+        pending = [NumberConverter]
+
+        while pending:
+            k = pending.pop()
+            pending.extend(k.__subclasses__())
+            result.append(k)
+
+        return result
+
+    @classmethod
+    def instrument(cls, callback=None):
+        """
+        Turn per-stage instrumentation on for all converters derived from NumberConverter, and converters registered with register().
+
+        @callback - function called after every stage with converter name, stage name, elapsed time in seconds and converter object (converter class for registered converters)
+
+        Stage methods are wrapped only while instrumentation is on, so that it adds no overhead otherwise. Caches of compiled functions named in a converter's "compiled" attribute are cleared whenever instrumentation is turned on or off, so that functions compiled meanwhile are recorded with Instrumentation.bind() and others are not.
+        Public read() and write() of Cyrillic and Roman converters are recorded through their table and state machine converters. Functions returned by compile_writer() are recorded if compiled while instrumentation is on. Writing into sinks (write_into(), write_lines()), sequence() generators and detect_iter() are not recorded, nor are results of conversion cache or numeral tables.
+        Converters defined after this call are not instrumented.
+        """
+
+        NumberConverter.uninstrument()
+        instrumentation = Instrumentation(callback)
+
+        for k in NumberConverter.classes():
+            for stage in NumberConverter.stages:
+                function = vars(k).get(stage)
+                if isinstance(function, classmethod):
+                    setattr(
+                        k,
+                        stage,
+                        classmethod(instrumentation.wrap(function.__func__, stage)),
+                    )
+                elif callable(function):
+                    setattr(k, stage, instrumentation.wrap(function, stage))
+
+        NumberConverter.instrumentation = instrumentation
+        NumberConverter.clearCompiled()
+
+    @classmethod
+    def uninstrument(cls):
+        "Turn per-stage instrumentation off."
+
+        if NumberConverter.instrumentation is None:
+            return
+
+        for k in NumberConverter.classes():
+            for stage in NumberConverter.stages:
+                function = vars(k).get(stage)
+                if isinstance(function, classmethod):
+                    if hasattr(function.__func__, "stage"):
+                        setattr(k, stage, classmethod(function.__func__.__wrapped__))
+                elif hasattr(function, "stage"):
+                    setattr(k, stage, function.__wrapped__)
+
+        NumberConverter.instrumentation = None
+        NumberConverter.clearCompiled()
+
+    @classmethod
+    def clearCompiled(cls):
+        "Clear caches of compiled functions of converters, see instrument()."
+
+        for k in NumberConverter.classes():
+            for name in vars(k).get("compiled", ()):
+                getattr(k, name).clear()
+
+    @classmethod
+    def snapshot(cls):
+        "Get statistics recorded by instrumentation, see Instrumentation.snapshot()."
+
+        if NumberConverter.instrumentation is None:
+            return {"stages": {}, "sizes": {}}
+
+        return NumberConverter.instrumentation.snapshot()
+
     def __init__(self, source, target, flags=0):
         self.source = source
         self.target = target
@@ -92,8 +655,7 @@ class NumberConverter:
     def purgeEmptyGroups(self):
         "Remove empty groups from numeral groups collection."
 
-        while self.groups.count(""):
-            self.groups.remove("")  # Purge empty groups
+        self.groups[:] = [k for k in self.groups if k != ""]  # Purge empty groups
         return self
 
     def convert(self):
@@ -107,6 +669,8 @@ class IntConverter(NumberConverter):
     Derive from this class to define converters into alphabetic numeral systems.
     """
 
+    __slots__ = ()
+
     def __init__(self, value, flags=0):
         super().__init__(value, "", flags)
 
@@ -120,6 +684,12 @@ class IntConverter(NumberConverter):
 
         return self
 
+    def build(self):
+        "Build the converted number from groups of numerals."
+
+        self.target = "".join(reversed(self.groups)) + self.target
+        return self
+
     @classmethod
     def getNumeral(cls, numeral):
         "Get alphabetic digit for given value."
@@ -134,9 +704,36 @@ class StrConverter(NumberConverter):
     Derive from this class to define converters from alphabetic numeral systems.
     """
 
+    __slots__ = ()
+
+    # Characters read as canonical strings, by canonical string ("" deletes them)
+    EQUIVALENTS = {}
+
+    normalizer = Normalizer(lambda cls: cls.equivalents())
+
     def __init__(self, alphabetic, flags=0):
         super().__init__(alphabetic, 0, flags)
 
+    @classmethod
+    def equivalents(cls):
+        """
+        Get equivalence classes to normalize numbers with: EQUIVALENTS, and case variants of numerals and of their equivalents.
+
+        Override EQUIVALENTS in a derived class to read other characters as numerals.
+        """
+
+        result = {}
+
+        for k in cls.dict_.values():
+            result[k] = Normalizer.caseVariants(k)
+
+        for canonical, k in cls.EQUIVALENTS.items():
+            if canonical:
+                k += Normalizer.caseVariants(k)
+            result[canonical] = result.get(canonical, "") + k
+
+        return result
+
     def validate(self):
         "Validate that source number is a non-empty string."
 
@@ -148,9 +745,15 @@ class StrConverter(NumberConverter):
         return self
 
     def prepare(self):
-        "Prepare source number for further operations."
+        "Prepare source number for further operations: strip whitespace and normalize characters."
+
+        self.source = str.translate(str.strip(self.source), self.normalizer)
+        return self
+
+    def build(self):
+        "Build the converted number from groups of numerals."
 
-        self.source = str.strip(self.source)
+        self.target = sum(self.groups, self.target)
         return self
 
     @classmethod
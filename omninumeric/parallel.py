@@ -0,0 +1,203 @@
+# -*- coding: UTF-8 -*-
+# For licensing information see LICENSE file included in the project's root directory.
+"""
+This module provides tools for converting large batches of numbers in parallel processes.
+
+Input is split into chunks, which are sent to worker processes in compact form: integers as array buffers, strings joined into a single string. Results keep input order.
+Input is read lazily, and only a few chunks per worker are in flight at once, so that memory does not grow with the whole batch.
+"""
+
+__all__ = ["Pool", "convert"]
+
+
+import importlib
+import os
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+CHUNKSIZE = 10000  # Default count of numbers sent to a worker at once
+PENDING = 2  # Count of chunks in flight per worker
+SEPARATOR = "\n"  # Separator for strings joined into a chunk
+
+SYSTEMS = {
+    "cyrillic": "omninumeric.cyrillic",
+    "roman": "omninumeric.roman",
+}
+
+# Conversion functions of a worker process, by numeral system, direction and flags
+functions = {}
+
+
+def getFunction(system, direction, flags=0):
+    """
+    Get conversion function for a numeral system.
+
+    @system - numeral system name ("cyrillic" or "roman")
+    @direction - "read" or "write"
+    @flags - conversion flags
+    """
+
+    if system not in SYSTEMS:
+        raise ValueError("Unknown numeral system: {0}".format(system))
+    if direction not in ("read", "write"):
+        raise ValueError('Direction must be "read" or "write"')
+
+    module = importlib.import_module(SYSTEMS[system])
+
+    if direction == "write" and hasattr(module, "compile_writer"):
+        return module.compile_writer(flags)
+
+    convert = getattr(module, direction)
+    return lambda number: convert(number, flags)
+
+
+def pack(values, direction):
+    "Pack a chunk of numbers for sending to a worker."
+
+    if direction == "write":
+        if all(type(k) is int for k in values):
+            try:
+                return array("q", values).tobytes()
+            except OverflowError:
+                pass
+
+    elif all(type(k) is str and SEPARATOR not in k for k in values):
+        return SEPARATOR.join(values)
+
+    return values
+
+
+def unpack(chunk, direction):
+    "Unpack a chunk of numbers packed with pack()."
+
+    if isinstance(chunk, bytes):
+        result = array("q")
+        result.frombytes(chunk)
+        return result
+
+    if isinstance(chunk, str):
+        return chunk.split(SEPARATOR)
+
+    return chunk
+
+
+def work(chunk, system, direction, flags):
+    """
+    Convert a chunk of numbers in a worker process. Returns results packed with pack().
+
+    Conversion functions are set up on first use in every worker process, and reused for later chunks.
+    """
+
+    key = (system, direction, flags)
+    try:
+        function = functions[key]
+    except KeyError:
+        function = functions[key] = getFunction(system, direction, flags)
+
+    result = [function(k) for k in unpack(chunk, direction)]
+    return pack(result, "read" if direction == "write" else "write")
+
+
+class Pool:
+    """
+    Pool of worker processes converting numbers in a numeral system.
+
+    Workers are set up once and reused for every chunk and every map() call.
+
+    @system - numeral system name ("cyrillic" or "roman")
+    @direction - "read" or "write"
+    @flags - conversion flags
+    @workers - count of worker processes, defaults to count of processors
+    """
+
+    def __init__(self, system="cyrillic", direction="write", flags=0, workers=None):
+        getFunction(system, direction, flags)  # Validate arguments
+
+        self.system = system
+        self.direction = direction
+        self.flags = flags
+        self.workers = workers or os.cpu_count() or 1
+        self.executor = ProcessPoolExecutor(self.workers)
+
+    def imap(self, values, chunksize=CHUNKSIZE):
+        """
+        Convert a batch of numbers lazily.
+
+        @values - any iterable of numbers, read a chunk at a time
+        @chunksize - count of numbers sent to a worker at once
+
+        Yields converted numbers in input order. At most PENDING chunks per worker are in flight. Errors raised by conversion are re-raised, and chunks not started yet are cancelled.
+        """
+
+        source = iter(values)
+        direction = "read" if self.direction == "write" else "write"
+        futures = deque()
+
+        try:
+            while True:
+                while len(futures) < self.workers * PENDING:
+                    chunk = list(islice(source, chunksize))
+                    if not chunk:
+                        break
+                    futures.append(
+                        self.executor.submit(
+                            work,
+                            pack(chunk, self.direction),
+                            self.system,
+                            self.direction,
+                            self.flags,
+                        )
+                    )
+
+                if not futures:
+                    return
+
+                yield from unpack(futures.popleft().result(), direction)
+        finally:
+            for k in futures:
+                k.cancel()
+
+    def map(self, values, chunksize=CHUNKSIZE):
+        """
+        Convert a batch of numbers. See imap().
+
+        Returns a list of converted numbers in input order.
+        """
+
+        return list(self.imap(values, chunksize))
+
+    def close(self):
+        self.executor.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def convert(
+    values,
+    system="cyrillic",
+    direction="write",
+    flags=0,
+    workers=None,
+    chunksize=CHUNKSIZE,
+):
+    """
+    Convert a batch of numbers in parallel processes.
+
+    @values - any iterable of numbers
+    @system - numeral system name ("cyrillic" or "roman")
+    @direction - "read" or "write"
+    @flags - conversion flags
+    @workers - count of worker processes, defaults to count of processors
+    @chunksize - count of numbers sent to a worker at once
+
+    Returns a list of converted numbers in input order.
+    """
+
+    with Pool(system, direction, flags, workers) as pool:
+        return pool.map(values, chunksize)
@@ -1,3 +1,12 @@
 from .roman import *
 
-__all__ = ["write", "read"]
+__all__ = [
+    "write",
+    "read",
+    "try_read",
+    "try_read_many",
+    "scan",
+    "sequence",
+    "write_into",
+    "write_lines",
+]
@@ -1,7 +1,8 @@
 # -*- coding: UTF-8 -*-
 # For licensing information see LICENSE file included in the project's root directory.
 
-import re, omninumeric
+import omninumeric
+from omninumeric import cache, table
 
 
 class Dictionary(omninumeric.Dictionary):
@@ -17,29 +18,43 @@ class Dictionary(omninumeric.Dictionary):
 
 class IntConverter(omninumeric.IntConverter):
 
+    __slots__ = ()
+
     dict_ = Dictionary
 
+    digit_tables = None  # Glyphs for digits 0-9, by decimal position
+
+    @classmethod
+    def buildTables(cls):
+        "Build glyph tables for every digit in every decimal position."
+
+        cls.digit_tables = tuple(
+            ("",)
+            + tuple(cls(k * pow(10, i)).convert() for k in range(1, 10 if i < 3 else 4))
+            for i in range(4)
+        )  # Thousands up to 3000 only
+
     def translateGroups(self):
 
+        glyphs = self.dict_.glyphs()
+
         for i, k in enumerate(self.groups):
             if k == 0:
                 result = ""
             elif k < 4:
-                result = self.dict_.get(1 * pow(10, i)) * k
+                result = glyphs.get(1 * pow(10, i)) * k
             elif k < 9:
-                result = self.dict_.get(5 * pow(10, i))
+                result = glyphs.get(5 * pow(10, i))
                 diff = k - 5
                 if diff < 0:
                     result = "{0}{1}".format(
-                        self.dict_.get(1 * pow(10, i)) * abs(diff), result
+                        glyphs.get(1 * pow(10, i)) * abs(diff), result
                     )
                 elif diff > 0:
-                    result = "{0}{1}".format(
-                        result, self.dict_.get(1 * pow(10, i)) * diff
-                    )
+                    result = "{0}{1}".format(result, glyphs.get(1 * pow(10, i)) * diff)
             else:
                 result = "{0}{1}".format(
-                    self.dict_.get(1 * pow(10, i)), self.dict_.get(1 * pow(10, i + 1))
+                    glyphs.get(1 * pow(10, i)), glyphs.get(1 * pow(10, i + 1))
                 )
 
             self.groups[i] = result
@@ -67,6 +82,8 @@ class IntConverter(omninumeric.IntConverter):
 
 class StrConverter(omninumeric.StrConverter):
 
+    __slots__ = ()
+
     dict_ = Dictionary
 
     regex_a = "{0}{{0,3}}"
@@ -83,19 +100,42 @@ class StrConverter(omninumeric.StrConverter):
         group_regex.format(Dictionary.get(1), Dictionary.get(5), Dictionary.get(10)),
     )
 
-    def prepare(self):
-        super().prepare()
-        self.source = str.upper(self.source)
-        return self
+    token_regex = r"(?<!\w)(?=[{0}]){1}(?!\w)".format(
+        "".join(k.name for k in Dictionary), number_regex[1:-1]
+    )
+
+    EQUIVALENTS = {
+        "I": "ıⅠⅰІ",
+        "II": "Ⅱⅱ",
+        "III": "Ⅲⅲ",
+        "IV": "Ⅳⅳ",
+        "V": "Ⅴⅴ",
+        "VI": "Ⅵⅵ",
+        "VII": "Ⅶⅶ",
+        "VIII": "Ⅷⅷ",
+        "IX": "Ⅸⅸ",
+        "X": "ⅩⅹХ",
+        "XI": "Ⅺⅺ",
+        "XII": "Ⅻⅻ",
+        "L": "Ⅼⅼ",
+        "C": "ⅭⅽС",
+        "D": "Ⅾⅾ",
+        "M": "ⅯⅿМ",
+    }  # Unicode Roman numeral forms and Cyrillic look-alikes
+
+    number_pattern = omninumeric.Pattern(lambda cls: cls.number_regex)
+    token_pattern = omninumeric.Pattern(lambda cls: cls.token_regex)
 
     def translateGroups(self):
 
+        values = self.dict_.values()
+
         for i, k in enumerate(self.groups):
             total = 0
             last = 1000
 
             for l in k:
-                l = self.dict_.get(l)
+                l = values.get(l)
                 total = total + l if l > last else total - l
                 last = l
 
@@ -106,9 +146,14 @@ class StrConverter(omninumeric.StrConverter):
     def breakIntoGroups(self):
 
         # print(self.source)
-        self.groups = list(re.fullmatch(self.number_regex, self.source).groups())
+        self.groups = list(self.number_pattern.fullmatch(self.source).groups())
         return self
 
+    def parse(self):
+        "Convert from Roman numeral system without raising errors. Returns a pair of converted number (0 if invalid) and error code."
+
+        return TableConverter.parse(self.source)
+
     def convert(self):
 
         return (
@@ -122,11 +167,191 @@ class StrConverter(omninumeric.StrConverter):
         )
 
 
+@omninumeric.NumberConverter.register
+class TableConverter:
+    """
+    Table-driven number converter for Roman numeral system.
+
+    Produces the same output as IntConverter and accepts the same strings as StrConverter.number_regex, but looks whole numbers up in tables of all numbers 1-3999, built once on first use.
+    """
+
+    LIMIT = 4000  # Value to stop tables before
+
+    numbers = None  # Numbers, by value ("" for 0)
+    values = None  # Values, by number
+    # Translation table normalizing numbers, same as StrConverter.normalizer
+    normalizer = None
+
+    @classmethod
+    def buildTables(cls):
+        "Build number and value tables."
+
+        if IntConverter.digit_tables is None:
+            IntConverter.buildTables()
+
+        numbers = ("",) + tuple(generate(1, cls.LIMIT, IntConverter.digit_tables))
+
+        cls.values = {k: i for i, k in enumerate(numbers) if i}
+        cls.normalizer = StrConverter.normalizer
+        cls.numbers = numbers
+
+    @classmethod
+    def write(cls, number):
+        "Convert into Roman numeral system."
+
+        if cls.numbers is None:
+            cls.buildTables()
+
+        if type(number) is int and 0 < number < cls.LIMIT:
+            return cls.numbers[number]
+
+        IntConverter(number).validate()
+        raise ValueError("Number must be less than {0}".format(cls.LIMIT))
+
+    @classmethod
+    def convert(cls, alphabetic, flags=0):
+        "Convert from Roman numeral system."
+
+        result, error = cls.parse(alphabetic, flags)
+        omninumeric.raiseError(error, alphabetic, "Roman")
+        return result
+
+    @classmethod
+    def parse(cls, alphabetic, flags=0):
+        """
+        Convert from Roman numeral system without raising errors.
+
+        Returns a pair of converted number (0 if invalid) and error code.
+        """
+
+        if not isinstance(alphabetic, str):
+            return 0, omninumeric.ERROR_TYPE
+
+        if cls.values is None:
+            cls.buildTables()
+
+        alphabetic = str.strip(alphabetic)
+        value = cls.values.get(alphabetic)
+
+        if value is None:  # Not a canonical number, normalize it
+            alphabetic = str.translate(alphabetic, cls.normalizer)
+            value = cls.values.get(alphabetic)
+
+        if value is not None:
+            return value, omninumeric.ERROR_NONE
+        if not alphabetic:
+            return 0, omninumeric.ERROR_EMPTY
+
+        return 0, omninumeric.ERROR_PATTERN
+
+
+@cache.cached("roman", "write")
+@table.tabled("roman", "write")
 def write(number, flags=0):
 
-    return IntConverter(number, flags).convert()
+    return TableConverter.write(number)
 
 
+@cache.cached("roman", "read")
+@table.tabled("roman", "read")
 def read(number, flags=0):
 
-    return StrConverter(number, flags).convert()
+    return TableConverter.convert(number, flags)
+
+
+def write_into(buf, number, flags=0):
+    """
+    Convert into Roman numeral system, writing into a buffer.
+
+    @buf - list, or any object with write() method (i.e. io.StringIO or text file)
+    """
+
+    omninumeric.getSink(buf)(TableConverter.write(number))
+
+
+def write_lines(values, out, flags=0):
+    """
+    Convert numbers into Roman numeral system, writing them into a buffer one per line.
+
+    @values - any iterable of natural numbers less than 4000
+    @out - list, or any object with write() method (i.e. io.StringIO or text file)
+    """
+
+    convert = TableConverter.write
+    write = omninumeric.getSink(out)
+
+    for k in values:
+        write(convert(k))
+        write("\n")
+
+
+def sequence(start, stop, flags=0):
+    """
+    Generate numbers in Roman numeral system for a range of values, same as write() for every value.
+
+    @start - first value, a natural number
+    @stop - value to stop before, up to 4000
+
+    Only the lowest digit is looked up on every step; higher digits are joined again once in 10 steps.
+    """
+
+    omninumeric.isinstanceEx(start, int, "Integer required, got {0}")
+    omninumeric.isinstanceEx(stop, int, "Integer required, got {0}")
+    if stop > start:
+        if start <= 0:
+            raise ValueError("Natural number required")
+        if stop > 4000:
+            raise ValueError("Number must be less than 4000")
+
+    if IntConverter.digit_tables is None:
+        IntConverter.buildTables()
+
+    return generate(start, stop, IntConverter.digit_tables)
+
+
+def generate(start, stop, tables):
+    "Generate numbers for sequence() from digit glyph tables."
+
+    ones, tens, hundreds, thousands = tables
+    higher = ""
+
+    for number in range(start, stop):
+        low = number % 10
+        if not low or number == start:
+            higher = (
+                thousands[number // 1000]
+                + hundreds[number // 100 % 10]
+                + tens[number // 10 % 10]
+            )
+        yield higher + ones[low]
+
+
+def scan(stream, chunksize=omninumeric.CHUNKSIZE):
+    """
+    Find and convert Roman numeral system numbers in a text stream.
+
+    Only uppercase numbers are matched.
+    Yields offset, length, raw token and converted number for every number found.
+    """
+
+    return omninumeric.scanStream(
+        stream,
+        StrConverter.token_pattern,
+        {k.name for k in Dictionary},
+        TableConverter.parse,
+        chunksize,
+    )
+
+
+def try_read(number, default=None):
+
+    result, error = TableConverter.parse(number)
+    return default if error else result
+
+
+def try_read_many(values, errors=False):
+
+    return omninumeric.parseMany(TableConverter.parse, values, errors)
+
+
+omninumeric.registerDetector("roman", StrConverter.token_regex, TableConverter.parse)
@@ -0,0 +1,269 @@
+# -*- coding: UTF-8 -*-
+# For licensing information see LICENSE file included in the project's root directory.
+"""
+This module provides persistent precomputed numeral tables, shared across processes with mmap.
+
+A table file holds written numbers for a range of values 1, 2, ... in one numeral system and style: native unsigned 32-bit offsets into a UTF-8 blob, followed by a hash index for reading numbers back. Loaded tables are memory-mapped, so that every process on a host shares the same pages.
+
+Once a table is loaded with load(), write() and read() of its numeral system look numbers up in it, and fall back to conversion for numbers outside of it.
+Lookups in loaded tables and unload() hold the same lock, so that a table is never closed while a number is looked up in it.
+"""
+
+__all__ = ["build", "load", "unload", "Table"]
+
+
+import struct
+from functools import wraps
+
+MAGIC = b"ONT1"
+# Magic, system name, flags, count, slots, blob size
+HEADER = struct.Struct("=4s16s4xQQQQ")
+
+STOP = {"cyrillic": 1000001, "roman": 4000}  # Default values to stop tables before
+LIMIT = 0xFFFFFFFF  # Maximum blob size and count of numbers, stored as unsigned 32-bit integers
+
+tables = {}  # Loaded tables, by numeral system name and flags
+readers = {}  # Loaded tables, by numeral system name
+lock = None  # Lock guarding loaded tables and lookups in them, created by load()
+
+
+def getSystem(system):
+    "Get numeral system module."
+
+    if system not in STOP:
+        raise ValueError("Unknown numeral system: {0}".format(system))
+
+    return __import__("omninumeric." + system, fromlist=["write"])
+
+
+def build(path, system="cyrillic", flags=0, stop=None):
+    """
+    Build a numeral table file.
+
+    @path - path to table file to write
+    @system - numeral system name ("cyrillic" or "roman")
+    @flags - conversion flags
+    @stop - value to stop table before, 1000001 for Cyrillic and 4000 for Roman by default
+
+    Returns count of numbers in the table.
+    """
+
+    import zlib
+    from array import array  # Imported on first use to keep package import fast
+
+    module = getSystem(system)
+    stop = STOP[system] if stop is None else stop
+    count = max(stop - 1, 0)
+
+    if count >= LIMIT:
+        raise ValueError("Table can not hold {0} numbers".format(count))
+
+    offsets = array("I", [0])
+    values = array("Q")
+    blob = bytearray()
+    slots = 1 << (2 * count).bit_length()  # At most half full
+    index = array("I", bytes(4 * slots))  # Entry numbers plus 1, 0 for empty slots
+
+    for number in range(1, stop):
+        key = module.write(number, flags).encode()
+        blob += key
+        if len(blob) > LIMIT:
+            raise ValueError("Table is too large: offsets exceed 32 bits")
+        offsets.append(len(blob))
+        values.append(module.read(key.decode()))  # Reading may be lossy
+
+        slot = zlib.crc32(key) & (slots - 1)
+        while index[slot]:
+            slot = (slot + 1) & (slots - 1)
+        index[slot] = number
+
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, system.encode(), flags, count, slots, len(blob)))
+        offsets.tofile(f)
+        if len(offsets) % 2:
+            f.write(bytes(4))  # Align values
+        values.tofile(f)
+        index.tofile(f)
+        f.write(blob)
+
+    return count
+
+
+class Table:
+    """
+    Memory-mapped numeral table.
+
+    Use build() to create table files, and load() to use a table in write() and read().
+    """
+
+    def __init__(self, path):
+        import mmap, zlib  # Imported on first use to keep package import fast
+
+        self.hash = zlib.crc32
+        self.file = open(path, "rb")
+        try:
+            self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        except BaseException:  # I.e. an empty file
+            self.file.close()
+            raise
+
+        try:
+            magic, system, self.flags, count, slots, size = HEADER.unpack_from(self.map)
+        except struct.error:
+            magic = None
+
+        if magic != MAGIC:
+            self.close()
+            raise ValueError("Not a numeral table file: {0}".format(path))
+
+        self.system = system.rstrip(b"\0").decode()
+        self.stop = count + 1
+        self.mask = slots - 1
+
+        start = HEADER.size + 4 * (count + 1 + (count + 1) % 2)
+        if start + 8 * count + 4 * slots + size != len(self.map) or size > LIMIT:
+            self.close()
+            raise ValueError("Numeral table file is corrupt: {0}".format(path))
+
+        view = memoryview(self.map)
+        start = HEADER.size
+        self.offsets = view[start : start + 4 * (count + 1)].cast("I")
+        start += 4 * (count + 1 + (count + 1) % 2)
+        self.values = view[start : start + 8 * count].cast("Q")
+        start += 8 * count
+        self.index = view[start : start + 4 * slots].cast("I")
+        start += 4 * slots
+        self.blob = view[start : start + size]
+
+        if self.offsets[count] != size:
+            self.close()
+            raise ValueError("Numeral table file is corrupt: {0}".format(path))
+
+    def __len__(self):
+        return self.stop - 1
+
+    def write(self, number):
+        "Get a written number. Returns None if @number is not in the table."
+
+        if not 0 < number < self.stop:
+            return None
+
+        return str(self.blob[self.offsets[number - 1] : self.offsets[number]], "utf-8")
+
+    def read(self, alphabetic):
+        "Get value of a written number. Returns None if @alphabetic is not in the table."
+
+        # Lone surrogates are never in the table, and are left to conversion to reject
+        key = alphabetic.encode("utf-8", "surrogatepass")
+        slot = self.hash(key) & self.mask
+
+        while True:
+            k = self.index[slot]
+            if not k:
+                return None
+            if self.blob[self.offsets[k - 1] : self.offsets[k]] == key:
+                return self.values[k - 1]
+            slot = (slot + 1) & self.mask
+
+    def close(self):
+        for k in ("offsets", "values", "index", "blob"):
+            if k in vars(self):
+                getattr(self, k).release()
+        self.map.close()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def load(path):
+    """
+    Load a numeral table, so that write() and read() of its numeral system use it. Replaces a table loaded before for the same numeral system and flags.
+
+    Returns the table loaded.
+    """
+
+    global lock
+
+    if lock is None:
+        import threading  # Imported on first use to keep package import fast
+
+        lock = threading.Lock()
+
+    table = Table(path)
+    unload(table.system, table.flags)
+
+    with lock:
+        tables[(table.system, table.flags)] = table
+        readers.setdefault(table.system, []).append(table)
+    return table
+
+
+def unload(system=None, flags=None):
+    """
+    Unload and close numeral tables. Waits for lookups in progress on other threads.
+
+    @system - numeral system name, all systems if not set
+    @flags - conversion flags, all flags if not set
+    """
+
+    if lock is None:  # Nothing loaded yet
+        return
+
+    with lock:
+        for key in list(tables):
+            if system in (None, key[0]) and flags in (None, key[1]):
+                table = tables.pop(key)
+                readers[key[0]].remove(table)
+                table.close()
+
+
+def tabled(system, direction):
+    """
+    Look numbers up in loaded numeral tables before converting them.
+
+    @system - numeral system name
+    @direction - "read" or "write"
+
+    Only int numbers are looked up for writing, and only str numbers for reading. Any table of the numeral system is used for reading.
+    """
+
+    def decorator(function):
+        if direction == "write":
+
+            @wraps(function)
+            def wrapper(number, flags=0):
+                if tables and type(number) is int:
+                    with lock:
+                        table = tables.get((system, flags))
+                        result = None if table is None else table.write(number)
+
+                    if result is not None:
+                        return result
+
+                return function(number, flags)
+
+        else:
+
+            @wraps(function)
+            def wrapper(number, flags=0):
+                if tables and type(number) is str:
+                    result = None
+
+                    with lock:
+                        for k in readers.get(system, ()):
+                            result = k.read(number)
+                            if result is not None:
+                                break
+
+                    if result is not None:
+                        return result
+
+                return function(number, flags)
+
+        return wrapper
+
+    return decorator
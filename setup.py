@@ -37,4 +37,5 @@ setup(
     ],
     packages=find_packages(),
     python_requires=">=3.4",
+    extras_require={"numpy": ["numpy"]},
 )
@@ -0,0 +1,92 @@
+# -*- coding: UTF-8 -*-
+import asyncio
+import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from omninumeric import aio, cyrillic, roman
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+async def collect(stream):
+    result = []
+    async for k in stream:
+        result.append(k)
+    return result
+
+
+class AsyncTestCase(unittest.TestCase):
+    def testWrite(self):
+        self.assertEqual(run(aio.write(1010, cyrillic.DELIM)), "҂а.і҃")
+        self.assertEqual(run(aio.write(1919, system="roman")), "MCMXIX")
+
+    def testRead(self):
+        self.assertEqual(run(aio.read(" вКА")), 2021)
+        self.assertEqual(run(aio.read("mcmxix", system="roman")), 1919)
+
+    def testReadStream(self):
+        lines = ["{0}\n".format(cyrillic.write(k)) for k in range(1, 3000)]
+        self.assertEqual(
+            run(collect(aio.read_stream(lines, chunksize=100, pending=2))),
+            [cyrillic.read(k) for k in lines],
+        )
+
+    def testWriteStreamAsync(self):
+        class Source:
+            def __init__(self):
+                self.values = iter(range(1, 500))
+
+            def __aiter__(self):
+                return self
+
+            async def __anext__(self):
+                try:
+                    return next(self.values)
+                except StopIteration:
+                    raise StopAsyncIteration
+
+        with ThreadPoolExecutor(2) as executor:
+            self.assertEqual(
+                run(
+                    collect(
+                        aio.write_stream(
+                            Source(), system="roman", chunksize=7, executor=executor
+                        )
+                    )
+                ),
+                [roman.write(k) for k in range(1, 500)],
+            )
+
+    def testProcessPool(self):
+        with ProcessPoolExecutor(1) as executor:
+            self.assertEqual(
+                run(aio.write(1010, cyrillic.DELIM, executor=executor)), "҂а.і҃"
+            )
+            self.assertEqual(
+                run(aio.read("MCMXIX", system="roman", executor=executor)), 1919
+            )
+            self.assertEqual(
+                run(
+                    collect(
+                        aio.read_stream(
+                            ["а҃", "в҃", "г҃"], chunksize=2, executor=executor
+                        )
+                    )
+                ),
+                [1, 2, 3],
+            )
+
+    def testError(self):
+        self.assertRaises(ValueError, run, aio.write(0))
+        self.assertRaises(
+            ValueError, run, collect(aio.read_stream(["а", "A113", "в"], chunksize=1))
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+# -*- coding: UTF-8 -*-
+import tracemalloc
+import unittest
+from omninumeric import cyrillic, roman
+from omninumeric.cyrillic import cyrillic as cyrillic_
+from omninumeric.roman import roman as roman_
+
+
+def peak(function, *args):
+    "Get peak memory allocated by a single call, in bytes."
+
+    function(*args)  # Warm up tables
+
+    tracemalloc.start()
+    try:
+        tracemalloc.clear_traces()
+        function(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+class SlotsTestCase(unittest.TestCase):
+    def testNoInstanceDict(self):
+        for converter in (
+            cyrillic_.IntConverter(1),
+            cyrillic_.StrConverter("а҃"),
+            roman_.IntConverter(1),
+            roman_.StrConverter("I"),
+        ):
+            self.assertFalse(hasattr(converter, "__dict__"))
+
+
+class AllocationTestCase(unittest.TestCase):
+    def testWrite(self):
+        self.assertLess(peak(cyrillic.write, 123456), 1024)
+        self.assertLess(peak(cyrillic.write, 123456, cyrillic.DELIMDOT), 1024)
+        self.assertLess(peak(roman.write, 3888), 1024)
+
+    def testRead(self):
+        self.assertLess(peak(cyrillic.read, "҂рк҃г"), 1024)
+        self.assertLess(peak(cyrillic.read, "҂рк.҂рк.рк҃г"), 1024)
+        self.assertLess(peak(roman.read, "MMMDCCCLXXXVIII"), 4096)
+
+    def testConverter(self):
+        self.assertLess(
+            peak(lambda: cyrillic_.IntConverter(123456, cyrillic.DELIM).convert()),
+            4096,
+        )
+        self.assertLess(peak(lambda: cyrillic_.StrConverter("҂рк҃г").convert()), 4096)
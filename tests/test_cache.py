@@ -0,0 +1,83 @@
+# -*- coding: UTF-8 -*-
+import threading
+import unittest
+from omninumeric import cache, cyrillic, roman
+
+
+class CacheTestCase(unittest.TestCase):
+    def setUp(self):
+        cache.enable(2)
+
+    def tearDown(self):
+        cache.disable()
+
+    def testCacheResults(self):
+        self.assertEqual(cyrillic.write(1), "а҃")
+        self.assertEqual(cyrillic.write(1), "а҃")
+        self.assertEqual(cyrillic.write(1, cyrillic.ENDDOT), "а҃.")
+        self.assertEqual(cache.cache_info(), cache.CacheInfo(1, 2, 2, 2))
+
+    def testCacheKeys(self):
+        self.assertEqual(cyrillic.read("а҃"), 1)
+        self.assertEqual(roman.read("I"), 1)
+        self.assertEqual(roman.write(1), "I")
+        self.assertRaises(TypeError, cyrillic.write, True)
+        self.assertEqual(cache.cache_info().hits, 0)
+
+    def testCacheUnhashableFlags(self):
+        self.assertEqual(cyrillic.read("а҃", {}), 1)
+        self.assertRaises(ValueError, cyrillic.read, "A113", [])
+        self.assertEqual(cache.cache_info(), cache.CacheInfo(0, 0, 2, 0))
+
+    def testCacheEviction(self):
+        roman.write(1)
+        roman.write(2)
+        roman.write(1)
+        roman.write(3)  # Evicts 2
+        roman.write(1)
+        roman.write(2)
+        self.assertEqual(cache.cache_info(), cache.CacheInfo(2, 4, 2, 2))
+
+    def testCacheClear(self):
+        roman.write(1)
+        cache.cache_clear()
+        self.assertEqual(cache.cache_info(), cache.CacheInfo(0, 0, 2, 0))
+
+    def testCacheErrors(self):
+        for i in range(2):
+            self.assertRaises(ValueError, cyrillic.write, 0)
+            self.assertRaises(ValueError, cyrillic.read, "A113")
+        self.assertEqual(cache.cache_info().currsize, 0)
+
+    def testCacheThreads(self):
+        cache.enable(100)
+
+        failed = []
+
+        def work():
+            for i in range(1, 1000):
+                number = i % 200 + 1
+                if roman.write(number) != roman.IntConverter(number).convert():
+                    failed.append(number)
+
+        threads = [threading.Thread(target=work) for i in range(4)]
+        for k in threads:
+            k.start()
+        for k in threads:
+            k.join()
+
+        self.assertEqual(failed, [])
+        info = cache.cache_info()
+        self.assertEqual(info.hits + info.misses, 4 * 999)
+        self.assertEqual(info.currsize, 100)
+
+    def testCacheDisabled(self):
+        cache.disable()
+        cyrillic.write(1)
+        self.assertEqual(cache.cache_info(), cache.CacheInfo(0, 0, 0, 0, False))
+        self.assertFalse(cache.cache_info().enabled)
+        self.assertTrue(cache.CacheInfo(0, 0, 0, 0).enabled)
+
+
+if __name__ == "__main__":
+    unittest.main()
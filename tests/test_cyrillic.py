@@ -1,6 +1,17 @@
 # -*- coding: UTF-8 -*-
+import array
+import io
+import mmap
+import os
+import pickle
+import tempfile
 import unittest
+import omninumeric
 from omninumeric.cyrillic import *
+from omninumeric.cyrillic import cyrillic, index
+from omninumeric.greek import greek
+
+numpy = omninumeric.getNumpy()
 
 
 class WritePlainTestCase(unittest.TestCase):
@@ -75,6 +86,102 @@ class WriteFlagsTestCase(unittest.TestCase):
         self.assertEqual(write(1001, ENDDOT + DELIMDOT), "҂а.а҃.")
 
 
+class DictionaryTestCase(unittest.TestCase):
+    def testGet(self):
+        self.assertEqual(cyrillic.Dictionary.get("ц"), 900)
+        self.assertEqual(cyrillic.Dictionary.get(900), "ц")
+        self.assertIsNone(cyrillic.Dictionary.get("z"))
+        self.assertIsNone(cyrillic.Dictionary.get(11))
+        self.assertIsNone(cyrillic.Dictionary.get([1]))
+
+    def testMaps(self):
+        self.assertEqual(cyrillic.Dictionary.values()["ц"], 900)
+        self.assertEqual(cyrillic.Dictionary.glyphs()[900], "ц")
+        self.assertEqual(len(cyrillic.Dictionary.glyphs()), len(cyrillic.Dictionary))
+        with self.assertRaises(TypeError):
+            cyrillic.Dictionary.glyphs()[1] = "a"
+        self.assertEqual(greek.Dictionary.glyphs(), {})
+
+    def testRanges(self):
+        self.assertEqual(cyrillic.Dictionary.digits(), "авгдєѕзиѳ")
+        self.assertEqual(cyrillic.Dictionary.tens(2, 3), "кл")
+        self.assertIs(cyrillic.Dictionary.hundreds(), cyrillic.Dictionary.hundreds())
+        self.assertRaises(ValueError, cyrillic.Dictionary.getmany, 1, 20)
+
+
+class WriteTableTestCase(unittest.TestCase):
+    def testWriteTableMatchesConverter(self):
+        for flags in range(32):
+            for number in (1, 11, 111, 1010, 11000, 100011, 111111111, 10001010001):
+                self.assertEqual(
+                    cyrillic.TableConverter.convert(number, flags),
+                    cyrillic.IntConverter(number, flags).convert(),
+                )
+
+
+class CompileWriterTestCase(unittest.TestCase):
+    def testCompileWriter(self):
+        for flags in range(32):
+            convert = compile_writer(flags)
+            self.assertIs(convert, compile_writer(flags))
+            for number in (1, 999, 1010, 100010, 111111111, 10**40 + 10):
+                self.assertEqual(
+                    convert(number), cyrillic.IntConverter(number, flags).convert()
+                )
+
+    def testCompileWriterError(self):
+        self.assertRaises(TypeError, compile_writer(ALLDOT), "String")
+        self.assertRaises(ValueError, compile_writer(ALLDOT), 0)
+
+
+class WriteIntoTestCase(unittest.TestCase):
+    def testWriteInto(self):
+        for flags in range(32):
+            for number in (1, 999, 1000, 1010, 2001, 100010, 111111111, 10**40 + 10):
+                buf = []
+                write_into(buf, number, flags)
+                self.assertEqual("".join(buf), write(number, flags))
+
+    def testWriteLines(self):
+        out = io.StringIO()
+        write_lines([1, 1010, 12345], out, DELIMDOT)
+        self.assertEqual(out.getvalue(), "а҃\n҂а.і҃\n҂ві.тм҃є\n")
+
+    def testWriteIntoError(self):
+        self.assertRaises(TypeError, write_into, [], "String")
+        self.assertRaises(ValueError, write_lines, [1, 0], [])
+
+
+class HugeTestCase(unittest.TestCase):
+    numbers = (10**400, 10**400 + 10**3 + 10, 7**2000, 123456789 * 10**3001)
+
+    def testSplitGroups(self):
+        for number in (0, 1, 1000) + self.numbers:
+            groups = []
+            source = number
+            while source > 0:
+                groups.append(source % 1000)
+                source = source // 1000
+            self.assertEqual(groups, greek.IntConverter.splitGroups(number))
+            self.assertEqual(number, greek.StrConverter.combineGroups(groups))
+
+    def testWriteHuge(self):
+        for number in self.numbers[:2]:
+            for flags in (0, DELIM, DELIMDOT):
+                self.assertEqual(
+                    write(number, flags),
+                    cyrillic.IntConverter(number, flags).convert(),
+                )
+
+    def testReadHuge(self):
+        for number in self.numbers[:2]:
+            for flags in (0, DELIM, DELIMDOT):
+                alphabetic = write(number, flags)
+                self.assertEqual(
+                    read(alphabetic), cyrillic.StrConverter(alphabetic).convert()
+                )
+
+
 class ReadDelimTestCase(unittest.TestCase):
     def testReadDigits(self):
         self.assertEqual(1, read("а҃"))
@@ -123,6 +230,311 @@ class ReadPlainTestCase(unittest.TestCase):
         self.assertEqual(111111111, read("҂҂р҂҂і҂҂а҂р҂і҂ара҃і"))
 
 
+class ReadStateTestCase(unittest.TestCase):
+    def testReadStateMatchesConverter(self):
+        for alphabetic in (
+            "а҃",
+            " вКА",
+            "пфхч҃ѱ",
+            "҂і҂а",
+            "҂҂раі.҂раі.ра҃і",
+            "р҂аі",
+            "а҂",
+            "҂",
+        ):
+            self.assertEqual(
+                cyrillic.StateConverter.convert(alphabetic),
+                cyrillic.StrConverter(alphabetic).convert(),
+            )
+
+    def testReadStateError(self):
+        self.assertRaises(ValueError, cyrillic.StateConverter.convert, "҃.")
+        self.assertRaises(ValueError, cyrillic.StateConverter.convert, "а а")
+
+
+class NormalizeTestCase(unittest.TestCase):
+    def testEquivalents(self):
+        self.assertEqual(read("҂AСЛ\u0487Д"), 1234)
+        self.assertEqual(read("рке\ufe2e"), 125)
+        self.assertEqual(read("ѵо\u0303"), 470)
+        self.assertEqual(read("ã"), 1)
+        self.assertEqual(
+            cyrillic.StrConverter("҂AСЛ\u0487Д").convert(),
+            cyrillic.StateConverter.convert("҂AСЛ\u0487Д"),
+        )
+        self.assertRaises(ValueError, read, "\u0487.")
+        self.assertRaises(ValueError, read, "b")
+
+    def testCustomEquivalents(self):
+        class Converter(cyrillic.StrConverter):
+            __slots__ = ()
+            EQUIVALENTS = dict(cyrillic.StrConverter.EQUIVALENTS, а="α")
+
+        self.assertEqual(Converter("Α҃").convert(), 1)
+        self.assertRaises(ValueError, cyrillic.StrConverter("α҃").convert)
+        self.assertIsNot(Converter.normalizer, cyrillic.StrConverter.normalizer)
+
+
+class ReadBytesTestCase(unittest.TestCase):
+    def testReadBytes(self):
+        for alphabetic in (
+            "а҃",
+            " вКА ",
+            "҂ѱн҃ѳ",
+            ".҂а.сл҃д.",
+            "҂҂раі.҂раі.ра҃і",
+            "р҂аі",
+            "҂",
+            "҂AСЛ\u0487Д",
+        ):
+            encoded = alphabetic.encode()
+            self.assertEqual(read_bytes(encoded), read(alphabetic))
+            self.assertEqual(read_bytes(bytearray(encoded)), read(alphabetic))
+            self.assertEqual(
+                read_bytes(memoryview(b"[" + encoded + b"]"), 1, -1), read(alphabetic)
+            )
+
+    def testReadBytesWritten(self):
+        for flags in (0, NOTITLO, WRAPDOT, DELIMDOT, ALLDOT):
+            for number in (1, 10, 11, 99, 120, 999, 1000, 1520, 11000, 123456):
+                self.assertEqual(read_bytes(write(number, flags).encode()), number)
+
+    def testReadBytesFormat(self):
+        encoded = "҂а҃і".encode()
+        self.assertEqual(read_bytes(memoryview(encoded).cast("H")), 11000)
+        self.assertEqual(read_bytes(array.array("b", encoded), 2), 11)
+
+    def testReadBytesMmap(self):
+        with tempfile.TemporaryFile() as f:
+            f.write("Стих ҂а҃і".encode())
+            f.flush()
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as source:
+                self.assertEqual(read_bytes(source, len("Стих ".encode())), 11000)
+
+    def testReadBytesError(self):
+        self.assertRaises(TypeError, read_bytes, "а҃")
+        self.assertRaises(ValueError, read_bytes, b" ")
+        self.assertRaises(ValueError, read_bytes, "а а".encode())
+        self.assertRaises(ValueError, read_bytes, "а҃".encode()[:-1])
+        self.assertRaises(ValueError, read_bytes, b"\xff\xd0")
+        self.assertRaises(ValueError, read_bytes, b"\xd0.\xb0")
+        self.assertRaises(ValueError, read_bytes, b"\xd2\x82\xd0\xd2\x83\xb0")
+
+
+class ReadFuzzyTestCase(unittest.TestCase):
+    def testReadFuzzy(self):
+        self.assertEqual(read_fuzzy("҂ар҃з"), (1107, 0))
+        self.assertEqual(read_fuzzy("р3҃"), (107, 1))
+        self.assertEqual(read_fuzzy("р кг"), (123, 1))
+        self.assertEqual(read_fuzzy("҂a4҃"), (1090, 1))
+        self.assertEqual(read_fuzzy("р,,к", 2), (120, 2))
+
+    def testReadFuzzyMatchesRead(self):
+        for number in range(1, 3000):
+            alphabetic = write(number, DELIMDOT)
+            self.assertEqual(read_fuzzy(alphabetic, 0), (read(alphabetic), 0))
+
+    def testReadFuzzyError(self):
+        self.assertRaises(ValueError, read_fuzzy, "р,,к")
+        self.assertRaises(ValueError, read_fuzzy, "bb", 2)
+        self.assertRaises(ValueError, read_fuzzy, " ")
+        self.assertRaises(TypeError, read_fuzzy, 1)
+
+
+class BatchTestCase(unittest.TestCase):
+    def testWriteMany(self):
+        self.assertEqual(
+            write_many([1, 1010, 10**30]), [write(1), write(1010), write(10**30)]
+        )
+        self.assertEqual(write_many((1001, 11000), DELIMDOT), ["҂а.а҃", "҂а҃і"])
+
+    def testReadMany(self):
+        self.assertEqual(list(read_many(["а҃", "҂а҃ѕ"])), [1, 1006])
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def testWriteManyArray(self):
+        values = numpy.array([[1, 11, 1010], [100010, 111111111, 10001010001]])
+        for flags in range(32):
+            result = write_many(values, flags)
+            self.assertEqual(result.shape, values.shape)
+            self.assertEqual(
+                result.ravel().tolist(),
+                [write(k, flags) for k in values.ravel().tolist()],
+            )
+
+    def testWriteManyEmptyGroups(self):
+        values = [1000000, 2000010, 10**9, 5000000000, 1000000001]
+        for flags in (DELIM, DELIMDOT, DELIM | ENDDOT | NOTITLO):
+            self.assertEqual(
+                write_many(values, flags), [write(k, flags) for k in values]
+            )
+        self.assertEqual(write_many([1000000], DELIM), ["҂҂а҃"])
+        self.assertEqual(write_many([2000010], DELIMDOT), ["҂҂в.і҃"])
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def testWriteManySmallTypes(self):
+        for dtype in ("int8", "uint8", "int16", "uint16", "uint64"):
+            values = numpy.array([1, 2, 100, 127], dtype=dtype)
+            self.assertEqual(
+                write_many(values).tolist(), [write(k) for k in (1, 2, 100, 127)]
+            )
+        self.assertEqual(
+            write_many(numpy.array([2**64 - 1], dtype="uint64")).tolist(),
+            [write(2**64 - 1)],
+        )
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def testReadManyArray(self):
+        self.assertEqual(read_many(["а҃", "в҃"]).dtype, numpy.int64)
+        self.assertEqual(read_many(["҂҂҂҂҂҂҂а"]).tolist(), [10**21])
+
+    def testBatchError(self):
+        self.assertRaises(TypeError, write_many, [1, "String"])
+        self.assertRaises(ValueError, write_many, [1, 0])
+        self.assertRaises(ValueError, read_many, ["а", "A113"])
+
+
+class SequenceTestCase(unittest.TestCase):
+    def testSequence(self):
+        for flags in range(32):
+            for start, stop in ((1, 1100), (999990, 1001010), (10**30 - 5, 10**30 + 5)):
+                self.assertEqual(
+                    list(sequence(start, stop, flags)),
+                    [write(k, flags) for k in range(start, stop)],
+                )
+
+    def testSequenceEmpty(self):
+        self.assertEqual(list(sequence(5, 5)), [])
+        self.assertEqual(list(sequence(0, -5)), [])
+
+    def testSequenceError(self):
+        self.assertRaises(TypeError, sequence, 1.0, 5)
+        self.assertRaises(ValueError, sequence, 0, 5)
+
+
+class NumeralTestCase(unittest.TestCase):
+    def testValue(self):
+        self.assertEqual(int(Numeral("҂аѳ҃і")), 1019)
+        self.assertEqual(Numeral("а҃і"), Numeral("аі"))
+        self.assertEqual(Numeral("р҃"), 100)
+        self.assertNotEqual(Numeral("р҃"), "р҃")
+
+    def testOrdering(self):
+        numerals = [Numeral(write(k)) for k in (30, 1, 2000, 1, 500)]
+        self.assertEqual([int(k) for k in sorted(numerals)], [1, 1, 30, 500, 2000])
+        self.assertEqual(len(set(numerals)), 4)
+        self.assertEqual({Numeral("а҃"): "a"}[Numeral("҃а")], "a")
+        self.assertTrue(Numeral("в҃") >= 2)
+        self.assertTrue(Numeral("а҃") < Numeral("в҃") <= Numeral("в҃"))
+
+    def testRender(self):
+        numeral = Numeral("҂аі")
+        self.assertEqual(numeral.render(DELIMDOT), write(11000, DELIMDOT))
+        self.assertIs(numeral.render(DELIMDOT), numeral.render(DELIMDOT))
+        self.assertEqual(str(numeral), "҂аі")
+
+    def testImmutable(self):
+        numeral = Numeral("а҃")
+        with self.assertRaises(AttributeError):
+            numeral.source = "в҃"
+        self.assertEqual(pickle.loads(pickle.dumps(numeral)), numeral)
+
+    def testError(self):
+        self.assertRaises(TypeError, Numeral, 1)
+        self.assertRaises(ValueError, int, Numeral("а а"))
+
+
+class TryReadTestCase(unittest.TestCase):
+    def testTryRead(self):
+        self.assertEqual(try_read("҂а҃ѕ"), 1006)
+        self.assertIsNone(try_read("A113"))
+        self.assertIsNone(try_read(""))
+        self.assertEqual(try_read(420, 0), 0)
+
+    def testTryReadMany(self):
+        result, mask, errors = try_read_many(["а҃", "", 420, "A113"], errors=True)
+        self.assertEqual(list(result), [1, 0, 0, 0])
+        self.assertEqual(list(mask), [True, False, False, False])
+        self.assertEqual(
+            list(errors),
+            [
+                omninumeric.ERROR_NONE,
+                omninumeric.ERROR_EMPTY,
+                omninumeric.ERROR_TYPE,
+                omninumeric.ERROR_PATTERN,
+            ],
+        )
+
+
+class ScanTestCase(unittest.TestCase):
+    text = "Глава а҃. И҆ ре́че .҂а.і҃. слово аминь, стих к҃в конец (ѯ҃)"
+    tokens = [
+        (6, 3, "а҃.", 1),
+        (19, 7, ".҂а.і҃.", 11000),
+        (45, 3, "к҃в", 22),
+        (56, 2, "ѯ҃", 60),
+    ]
+
+    def testScan(self):
+        self.assertEqual(list(scan(io.StringIO(self.text))), self.tokens)
+
+    def testScanChunks(self):
+        for chunksize in range(1, 20):
+            self.assertEqual(
+                list(scan(io.StringIO(self.text), chunksize=chunksize)), self.tokens
+            )
+
+    def testScanNotitlo(self):
+        self.assertEqual(
+            list(scan(io.StringIO("а в҃"), NOTITLO)),
+            [(0, 1, "а", 1), (2, 2, "в҃", 2)],
+        )
+
+
+class IndexTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.corpus = os.path.join(self.directory.name, "corpus.txt")
+        self.index = os.path.join(self.directory.name, "corpus.idx")
+
+        with open(self.corpus, "w", encoding="utf-8") as f:
+            f.write(ScanTestCase.text * 2)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def testAnnotate(self):
+        self.assertEqual(index.annotate(self.corpus, self.index), 8)
+
+        with open(self.corpus, encoding="utf-8") as f:
+            text = f.read()
+
+        expected = sorted(
+            (len(text[: k[0]].encode()), k[3]) for k in scan(io.StringIO(text))
+        )
+
+        with index.Index(self.index) as result:
+            self.assertEqual(sorted(result[i] for i in range(len(result))), expected)
+
+    def testAnnotateWordBoundaries(self):
+        with open(self.corpus, "w", encoding="utf-8") as f:
+            f.write("éа҃ βв҃ а҃ ſг҃ x.д҃")
+
+        for flags in (0, NOTITLO):
+            self.assertEqual(index.annotate(self.corpus, self.index, flags), 2)
+
+            with index.Index(self.index) as result:
+                self.assertEqual([result[0], result[1]], [(14, 1), (28, 4)])
+
+    def testQuery(self):
+        index.annotate(self.corpus, self.index)
+
+        with index.Index(self.index) as result:
+            self.assertEqual([k[1] for k in result.query(20, 100)], [22, 22, 60, 60])
+            self.assertEqual(result.query(23, 59), [])
+            self.assertEqual(len(result.query(1)), 2)
+
+
 class ErrorTestCase(unittest.TestCase):
     def testWriteError(self):
         self.assertRaises(TypeError, write, "String")
@@ -0,0 +1,71 @@
+# -*- coding: UTF-8 -*-
+import io
+import random
+import unittest
+import omninumeric
+from omninumeric import cyrillic, roman
+
+
+class DetectTestCase(unittest.TestCase):
+    def tearDown(self):
+        omninumeric.detectors.pop("arabic", None)
+        omninumeric.detection.clear()
+
+    def testDetect(self):
+        text = "Глава XIV. Стих ҂а҃і и .ві҃, также I, mix и MMMM"
+        self.assertEqual(
+            omninumeric.detect_and_read(text),
+            [
+                ("roman", 14, (6, 9)),
+                ("cyrillic", 11000, (16, 20)),
+                ("cyrillic", 12, (23, 27)),
+                ("roman", 1, (35, 36)),
+            ],
+        )
+        self.assertEqual(
+            list(omninumeric.detect_iter(text, ["roman"])),
+            [("roman", 14, (6, 9)), ("roman", 1, (35, 36))],
+        )
+
+    def testDetectMatchesScan(self):
+        generator = random.Random(0)
+        words = []
+        for i in range(2000):
+            k = generator.randrange(1, 4000)
+            words.append(
+                generator.choice(
+                    (
+                        roman.write(k),
+                        cyrillic.write(k),
+                        cyrillic.write(k, cyrillic.DELIMDOT),
+                        "слово",
+                        "word",
+                    )
+                )
+            )
+        text = " ".join(words)
+
+        expected = [
+            (k[0], "cyrillic", k[3], (k[0], k[0] + k[1]))
+            for k in cyrillic.scan(io.StringIO(text))
+        ] + [
+            (k[0], "roman", k[3], (k[0], k[0] + k[1]))
+            for k in roman.scan(io.StringIO(text))
+        ]
+        self.assertEqual(
+            omninumeric.detect_and_read(text), [k[1:] for k in sorted(expected)]
+        )
+
+    def testRegister(self):
+        omninumeric.registerDetector(
+            "arabic", r"(?<!\w)\d+(?!\w)", lambda k: (int(k), omninumeric.ERROR_NONE)
+        )
+        self.assertEqual(
+            omninumeric.detect_and_read("XIV 14", ["arabic", "roman"]),
+            [("roman", 14, (0, 3)), ("arabic", 14, (4, 6))],
+        )
+        self.assertRaises(ValueError, omninumeric.detect_and_read, "", ["unknown"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+# -*- coding: UTF-8 -*-
+import subprocess
+import sys
+import unittest
+import omninumeric
+from omninumeric.cyrillic import cyrillic
+
+
+def run(code):
+    "Run code in a fresh interpreter, return its output."
+
+    return subprocess.check_output([sys.executable, "-c", code]).decode().split()
+
+
+class LazyImportTestCase(unittest.TestCase):
+    @unittest.skipIf(
+        sys.version_info < (3, 7), "Module __getattr__ requires Python 3.7+"
+    )
+    def testSubmoduleAttribute(self):
+        self.assertEqual(
+            run(
+                "import omninumeric\n"
+                "print(omninumeric.roman.write(14), 'cyrillic' in dir(omninumeric))"
+            ),
+            ["XIV", "True"],
+        )
+
+    def testNoRegexOnWrite(self):
+        self.assertEqual(
+            run(
+                "import sys\n"
+                "from omninumeric import cyrillic\n"
+                "cyrillic.write(1234, cyrillic.DELIMDOT)\n"
+                "cyrillic.read('\\u0482\\u0430\\u0441\\u043b\\u0483\\u0434')\n"
+                "from omninumeric import roman\n"
+                "roman.read(roman.write(1234))\n"
+                "print('re' in sys.modules, 'threading' in sys.modules)"
+            ),
+            ["False", "False"],
+        )
+
+    def testUnknownAttribute(self):
+        self.assertRaises(AttributeError, getattr, omninumeric, "unknown")
+
+
+class PatternTestCase(unittest.TestCase):
+    def testCompiledOnce(self):
+        self.assertIs(
+            cyrillic.StrConverter.number_pattern, cyrillic.StrConverter.number_pattern
+        )
+        self.assertIsNotNone(cyrillic.StrConverter.number_pattern.fullmatch("҂аі"))
+
+    def testSubclass(self):
+        class Converter(cyrillic.StrConverter):
+            __slots__ = ()
+            regex = "а"
+
+        self.assertEqual(Converter.number_pattern.pattern, "а+")
+        self.assertNotEqual(
+            cyrillic.StrConverter.number_pattern.pattern,
+            Converter.number_pattern.pattern,
+        )
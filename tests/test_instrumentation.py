@@ -0,0 +1,78 @@
+# -*- coding: UTF-8 -*-
+import unittest
+from omninumeric import NumberConverter
+from omninumeric.cyrillic import cyrillic
+from omninumeric.roman import roman
+
+
+class InstrumentationTestCase(unittest.TestCase):
+    def tearDown(self):
+        NumberConverter.uninstrument()
+
+    def testStages(self):
+        NumberConverter.instrument()
+        for k in range(1, 11):
+            cyrillic.IntConverter(k * 1000, cyrillic.DELIM).convert()
+        cyrillic.StrConverter("҂а҃і").convert()
+
+        stages = NumberConverter.snapshot()["stages"]
+        self.assertEqual(stages["cyrillic.IntConverter.convert"]["calls"], 10)
+        self.assertEqual(stages["cyrillic.IntConverter.swapDigits"]["calls"], 10)
+        self.assertEqual(stages["cyrillic.StrConverter.translateGroups"]["calls"], 1)
+        self.assertGreaterEqual(
+            stages["cyrillic.IntConverter.convert"]["time"],
+            stages["cyrillic.IntConverter.swapDigits"]["time"],
+        )
+
+    def testSizes(self):
+        NumberConverter.instrument()
+        roman.IntConverter(1).convert()
+        roman.IntConverter(3).convert()
+        roman.StrConverter("III").convert()
+
+        sizes = NumberConverter.snapshot()["sizes"]
+        self.assertEqual(sizes["roman.IntConverter"], {1: 1, 2: 1})
+        self.assertEqual(sizes["roman.StrConverter"], {3: 1})
+
+    def testCallback(self):
+        calls = []
+        NumberConverter.instrument(lambda *args: calls.append(args[:2]))
+        roman.IntConverter(1).convert()
+
+        self.assertIn(("roman.IntConverter", "translateGroups"), calls)
+        self.assertEqual(calls[-1], ("roman.IntConverter", "convert"))
+
+    def testPublic(self):
+        NumberConverter.instrument()
+        cyrillic.write(1010)
+        cyrillic.read("҂а҃і")
+        cyrillic.try_read("҂а҃і")
+        roman.write(3)
+        roman.read("III")
+
+        snapshot = NumberConverter.snapshot()
+        stages = snapshot["stages"]
+        self.assertEqual(stages["cyrillic.TableConverter.convert"]["calls"], 1)
+        self.assertEqual(stages["cyrillic.StateConverter.convert"]["calls"], 1)
+        self.assertEqual(stages["cyrillic.StateConverter.parse"]["calls"], 2)
+        self.assertEqual(stages["roman.TableConverter.write"]["calls"], 1)
+        self.assertEqual(stages["roman.TableConverter.parse"]["calls"], 1)
+        self.assertEqual(snapshot["sizes"]["cyrillic.TableConverter"], {10: 1})
+        self.assertEqual(snapshot["sizes"]["cyrillic.StateConverter"], {4: 1})
+
+    def testOff(self):
+        swapDigits = cyrillic.IntConverter.swapDigits
+        NumberConverter.instrument()
+        self.assertIsNot(cyrillic.IntConverter.swapDigits, swapDigits)
+        writer = cyrillic.compile_writer()
+
+        NumberConverter.uninstrument()
+        self.assertIs(cyrillic.IntConverter.swapDigits, swapDigits)
+        self.assertIsNot(cyrillic.compile_writer(), writer)
+        self.assertFalse(hasattr(cyrillic.compile_writer(), "func"))
+        self.assertFalse(hasattr(cyrillic.StateConverter.parse, "stage"))
+        self.assertEqual(NumberConverter.snapshot(), {"stages": {}, "sizes": {}})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+# -*- coding: UTF-8 -*-
+import unittest
+from omninumeric import cyrillic, parallel, roman
+
+
+class ParallelTestCase(unittest.TestCase):
+    def testWrite(self):
+        values = list(range(1, 2000)) + [10**30]
+        self.assertEqual(
+            parallel.convert(values, flags=cyrillic.ALLDOT, workers=2, chunksize=300),
+            [cyrillic.write(k, cyrillic.ALLDOT) for k in values],
+        )
+
+    def testRead(self):
+        values = [roman.write(k) for k in range(1, 4000)]
+        self.assertEqual(
+            parallel.convert(values, "roman", "read", workers=2, chunksize=500),
+            list(range(1, 4000)),
+        )
+
+    def testPool(self):
+        with parallel.Pool("cyrillic", "read", workers=1) as pool:
+            self.assertEqual(pool.map(["а҃", "в҃"]), [1, 2])
+            self.assertEqual(pool.map(["҂҂҂҂҂҂҂а"]), [10**21])
+
+    def testLazy(self):
+        consumed = []
+
+        def values():
+            for k in range(1, 1000):
+                consumed.append(k)
+                yield k
+
+        with parallel.Pool(workers=1) as pool:
+            result = pool.imap(values(), chunksize=10)
+            self.assertEqual(next(result), "а҃")
+            self.assertLessEqual(len(consumed), 10 * parallel.PENDING)
+            self.assertEqual(list(result), [cyrillic.write(k) for k in range(2, 1000)])
+
+    def testError(self):
+        self.assertRaises(ValueError, parallel.convert, [1, 0], workers=1)
+        self.assertRaises(TypeError, parallel.convert, [1, "String"], workers=1)
+        self.assertRaises(ValueError, parallel.convert, [1], "greek")
+        self.assertRaises(ValueError, parallel.convert, [1], direction="convert")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,8 @@
 # -*- coding: UTF-8 -*-
+import io
 import unittest
 from omninumeric.roman import *
+from omninumeric.roman import roman
 
 
 class WriteBasicTestCase(unittest.TestCase):
@@ -131,5 +133,72 @@ class ReadAdvancedTestCase(unittest.TestCase):
         self.assertEqual(2022, read("MMXXII"))
 
 
+class TableTestCase(unittest.TestCase):
+    def testTable(self):
+        for k in range(1, 4000):
+            alphabetic = roman.IntConverter(k).convert()
+            self.assertEqual(write(k), alphabetic)
+            self.assertEqual(read(alphabetic), k)
+            self.assertEqual(read(alphabetic.lower()), k)
+
+    def testTableError(self):
+        self.assertRaises(ValueError, write, 4000)
+        self.assertRaises(ValueError, write, 0)
+        self.assertRaises(TypeError, write, 1.0)
+        self.assertRaises(ValueError, read, "IIII")
+        self.assertRaises(ValueError, read, "MMMM")
+        self.assertRaises(ValueError, read, " ")
+        self.assertRaises(TypeError, read, 1)
+
+
+class WriteIntoTestCase(unittest.TestCase):
+    def testWriteInto(self):
+        buf = io.StringIO()
+        write_into(buf, 14)
+        write_lines([1919, 2022], buf)
+        self.assertEqual(buf.getvalue(), "XIVMCMXIX\nMMXXII\n")
+        self.assertRaises(ValueError, write_into, [], 4000)
+
+
+class NormalizeTestCase(unittest.TestCase):
+    def testEquivalents(self):
+        self.assertEqual(read("ⅯⅭⅯⅩⅨ"), 1919)
+        self.assertEqual(read("ⅿⅿⅹⅻ"), 2022)
+        self.assertEqual(read("ХІV"), 14)
+        self.assertIsNone(try_read("ⅯⅯⅯⅯ"))
+
+
+class TryReadTestCase(unittest.TestCase):
+    def testTryRead(self):
+        self.assertEqual(try_read("mcmxix"), 1919)
+        self.assertIsNone(try_read("IIII"))
+        self.assertIsNone(try_read(" "))
+        self.assertIsNone(try_read(1919))
+
+    def testTryReadMany(self):
+        result, mask = try_read_many(["XIV", "IC"])
+        self.assertEqual(list(result), [14, 0])
+        self.assertEqual(list(mask), [True, False])
+
+
+class SequenceTestCase(unittest.TestCase):
+    def testSequence(self):
+        self.assertEqual(list(sequence(1, 4000)), [write(k) for k in range(1, 4000)])
+        self.assertEqual(list(sequence(48, 52)), ["XLVIII", "XLIX", "L", "LI"])
+
+    def testSequenceError(self):
+        self.assertRaises(TypeError, sequence, 1, 5.0)
+        self.assertRaises(ValueError, sequence, 0, 5)
+        self.assertRaises(ValueError, sequence, 1, 4001)
+
+
+class ScanTestCase(unittest.TestCase):
+    def testScan(self):
+        text = "Chapter XIV, verse IX. MIXED MCMXIX IIII"
+        tokens = [(8, 3, "XIV", 14), (19, 2, "IX", 9), (29, 6, "MCMXIX", 1919)]
+        for chunksize in (1, 2, 3, 7, 1000):
+            self.assertEqual(list(scan(io.StringIO(text), chunksize=chunksize)), tokens)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,140 @@
+# -*- coding: UTF-8 -*-
+import gc
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import unittest
+import warnings
+from omninumeric import cyrillic, roman, table
+
+
+class TableTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.mkdtemp()
+        cls.cyrillic = os.path.join(cls.directory, "cyrillic.ont")
+        cls.roman = os.path.join(cls.directory, "roman.ont")
+        table.build(cls.cyrillic, "cyrillic", cyrillic.DELIMDOT, 3000)
+        table.build(cls.roman, "roman")
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.directory)
+
+    def tearDown(self):
+        table.unload()
+
+    def testTable(self):
+        with table.Table(self.cyrillic) as t:
+            self.assertEqual(len(t), 2999)
+            self.assertEqual((t.system, t.flags), ("cyrillic", cyrillic.DELIMDOT))
+            for k in range(1, 3000):
+                alphabetic = cyrillic.write(k, cyrillic.DELIMDOT)
+                self.assertEqual(t.write(k), alphabetic)
+                self.assertEqual(t.read(alphabetic), cyrillic.read(alphabetic))
+            self.assertIsNone(t.write(0))
+            self.assertIsNone(t.write(3000))
+            self.assertIsNone(t.read("҂г"))
+
+    def testRoman(self):
+        with table.Table(self.roman) as t:
+            for k in range(1, 4000):
+                self.assertEqual(t.read(t.write(k)), k)
+
+    def testLoad(self):
+        table.load(self.cyrillic)
+        table.load(self.roman)
+        self.assertEqual(cyrillic.write(1234, cyrillic.DELIMDOT), "҂а.сл҃д")
+        self.assertEqual(cyrillic.write(12345, cyrillic.DELIMDOT), "҂ві.тм҃є")
+        self.assertEqual(cyrillic.write(1234), "҂асл҃д")
+        self.assertEqual(cyrillic.read("҂а.сл҃д"), 1234)
+        self.assertEqual(cyrillic.read("҂асл҃д"), 1234)
+        self.assertEqual(roman.write(3888), "MMMDCCCLXXXVIII")
+        self.assertEqual(roman.read("MMMDCCCLXXXVIII"), 3888)
+        self.assertRaises(ValueError, cyrillic.write, 0, cyrillic.DELIMDOT)
+        for read in (cyrillic.read, roman.read):
+            with self.assertRaises(ValueError) as error:
+                read("\ud800")
+            self.assertNotIsInstance(error.exception, UnicodeError)
+
+    def testUnload(self):
+        t = table.load(self.cyrillic)
+        table.load(self.roman)
+        table.unload("roman")
+        self.assertEqual(list(table.tables), [("cyrillic", cyrillic.DELIMDOT)])
+        self.assertEqual(table.load(self.cyrillic).system, "cyrillic")
+        self.assertEqual(len(table.readers["cyrillic"]), 1)
+        self.assertRaises(ValueError, t.write, 1)
+
+    def testUnloadInUse(self):
+        t = table.load(self.roman)
+        unloading = threading.Thread(target=table.unload)
+
+        with table.lock:  # Lookup in progress
+            unloading.start()
+            unloading.join(0.05)
+            self.assertTrue(unloading.is_alive())
+            self.assertEqual(t.write(14), "XIV")
+
+        unloading.join()
+        self.assertRaises(ValueError, t.write, 14)
+
+    def testUnloadThreads(self):
+        failed = []
+        done = threading.Event()
+
+        def work():
+            i = 0
+            while not done.is_set():
+                i = i % 3999 + 1
+                try:
+                    if roman.read(roman.write(i)) != i:
+                        failed.append(i)
+                except Exception as e:
+                    failed.append(e)
+
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        threads = [threading.Thread(target=work) for i in range(4)]
+        try:
+            for k in threads:
+                k.start()
+            for i in range(100):
+                table.load(self.roman)
+                time.sleep(0.0005)
+                table.unload()
+        finally:
+            done.set()
+            for k in threads:
+                k.join()
+            sys.setswitchinterval(interval)
+
+        self.assertEqual(failed, [])
+
+    def testInvalid(self):
+        path = os.path.join(self.directory, "invalid.ont")
+        with open(path, "wb") as f:
+            f.write(b"NOTATABLE")
+        self.assertRaises(ValueError, table.Table, path)
+        self.assertRaises(ValueError, table.build, path, "greek")
+        self.assertRaises(ValueError, table.build, path, "roman", 0, table.LIMIT + 1)
+
+        open(path, "wb").close()
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always", ResourceWarning)
+            self.assertRaises(ValueError, table.Table, path)
+            gc.collect()
+        self.assertEqual([k for k in caught if k.category is ResourceWarning], [])
+
+        with open(self.roman, "rb") as f:
+            data = f.read()
+        with open(path, "wb") as f:
+            f.write(data[:-1])
+        self.assertRaises(ValueError, table.Table, path)
+
+
+if __name__ == "__main__":
+    unittest.main()